@@ -103,10 +103,83 @@ else:
             "PASSWORD": config('DATABASES_DEFAULT_PASSWORD'),
             "HOST": config('DATABASES_DEFAULT_HOST'),
             "PORT": config('DATABASES_DEFAULT_PORT', default='5432'),
+            # Reuse connections across requests instead of connecting each time,
+            # checking they're still usable before a request uses them
+            "CONN_MAX_AGE": config('DATABASES_CONN_MAX_AGE', default=60, cast=int),
+            "CONN_HEALTH_CHECKS": True,
+            # Required behind a transaction-pooling pgbouncer
+            "DISABLE_SERVER_SIDE_CURSORS": config('DATABASES_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool),
         }
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# A shared Redis cache lets all workers reuse cross-service lookups
+
+REDIS_URL = config('REDIS_URL', default=None)
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
+# Number of rows inserted per query by the bulk_create_validated helpers
+HR_BULK_CREATE_BATCH_SIZE = config('HR_BULK_CREATE_BATCH_SIZE', default=1000, cast=int)
+
+# Seconds that cross-service validation lookups are cached (existing / not found)
+HR_VALIDATION_CACHE_TIMEOUT = config('HR_VALIDATION_CACHE_TIMEOUT', default=300, cast=int)
+HR_VALIDATION_NEGATIVE_CACHE_TIMEOUT = config('HR_VALIDATION_NEGATIVE_CACHE_TIMEOUT', default=30, cast=int)
+# Seconds that each worker also keeps a lookup in its own memory in front of the shared cache
+HR_VALIDATION_LOCAL_CACHE_TIMEOUT = config('HR_VALIDATION_LOCAL_CACHE_TIMEOUT', default=10, cast=int)
+# Deadline in seconds for each gRPC call made by the cross-service validators
+GRPC_VALIDATE_TIMEOUT_SEC = config('GRPC_VALIDATE_TIMEOUT_SEC', default=2.0, cast=float)
+
+# Fail validations immediately for HR_VALIDATION_CIRCUIT_RESET_TIMEOUT seconds after
+# HR_VALIDATION_CIRCUIT_FAIL_MAX consecutive connection failures or timeouts of a service
+HR_VALIDATION_CIRCUIT_FAIL_MAX = config('HR_VALIDATION_CIRCUIT_FAIL_MAX', default=3, cast=int)
+HR_VALIDATION_CIRCUIT_RESET_TIMEOUT = config('HR_VALIDATION_CIRCUIT_RESET_TIMEOUT', default=5, cast=int)
+
+# Seconds that a successful token verification is cached (capped at the token's expiry)
+AUTH_VERIFY_CACHE_TTL = config('AUTH_VERIFY_CACHE_TTL', default=30, cast=int)
+# Upper bound in seconds for caching a rejected token (randomised from 1 second)
+AUTH_VERIFY_NEGATIVE_CACHE_TTL = config('AUTH_VERIFY_NEGATIVE_CACHE_TTL', default=3, cast=int)
+
+# Seconds before a slow token verification is sent again to the auth service.
+# Unset, the p95 of recent verifications is used. At most about
+# AUTH_VERIFY_HEDGING_RATIO of verifications are sent twice.
+AUTH_VERIFY_HEDGING_DELAY = config('AUTH_VERIFY_HEDGING_DELAY', default=None, cast=lambda v: float(v) if v else None)
+AUTH_VERIFY_HEDGING_RATIO = config('AUTH_VERIFY_HEDGING_RATIO', default=0.1, cast=float)
+
+# Stop calling the auth service for AUTH_CIRCUIT_RESET_TIMEOUT seconds after
+# AUTH_CIRCUIT_FAIL_MAX consecutive connection failures or timeouts
+AUTH_CIRCUIT_FAIL_MAX = config('AUTH_CIRCUIT_FAIL_MAX', default=10, cast=int)
+AUTH_CIRCUIT_RESET_TIMEOUT = config('AUTH_CIRCUIT_RESET_TIMEOUT', default=30, cast=int)
+
+# Verify access tokens locally against the auth service's signing keys (JWKS)
+# instead of over gRPC. Leave AUTH_JWKS_URL unset to always ask the auth service.
+AUTH_JWKS_URL = config('AUTH_JWKS_URL', default=None)
+AUTH_JWKS_CACHE_TTL = config('AUTH_JWKS_CACHE_TTL', default=300, cast=int)
+# Deadline in seconds for fetching the key set, and how long to skip local
+# verification after a failed fetch or an unknown key id
+AUTH_JWKS_TIMEOUT = config('AUTH_JWKS_TIMEOUT', default=GRPC_VALIDATE_TIMEOUT_SEC, cast=float)
+AUTH_JWKS_RETRY_AFTER = config('AUTH_JWKS_RETRY_AFTER', default=5, cast=int)
+AUTH_JWT_ALGORITHMS = config('AUTH_JWT_ALGORITHMS', default='RS256,ES256,EdDSA', cast=Csv())
+AUTH_JWT_AUDIENCE = config('AUTH_JWT_AUDIENCE', default=None)
+AUTH_JWT_ISSUER = config('AUTH_JWT_ISSUER', default=None)
+AUTH_JWT_USER_ID_CLAIM = config('AUTH_JWT_USER_ID_CLAIM', default='user_id')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
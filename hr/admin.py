@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from .models import (
     JobPosting, Applicant, LeaveRequest,
     PerformanceReview, Payroll, TrainingProgram, Asset,
@@ -61,6 +62,7 @@ class ApplicantAdmin(admin.ModelAdmin):
     ordering = ['-created_at']
     date_hierarchy = 'created_at'
     autocomplete_fields = ['job_posting']
+    actions = ['move_to_screening', 'mark_shortlisted', 'mark_hired', 'mark_rejected']
 
     fieldsets = (
         ('Application Info', {
@@ -81,6 +83,26 @@ class ApplicantAdmin(admin.ModelAdmin):
         }),
     )
 
+    @admin.action(description='Move selected applicants to screening')
+    def move_to_screening(self, request, queryset):
+        updated = queryset.mark_stage(Applicant.Stage.SCREENING)
+        self.message_user(request, f'{updated} applicant(s) moved to screening.')
+
+    @admin.action(description='Mark selected applicants as shortlisted')
+    def mark_shortlisted(self, request, queryset):
+        updated = queryset.mark_status(Applicant.Status.SHORTLISTED)
+        self.message_user(request, f'{updated} applicant(s) marked as shortlisted.')
+
+    @admin.action(description='Mark selected applicants as hired')
+    def mark_hired(self, request, queryset):
+        updated = queryset.mark_status(Applicant.Status.HIRED)
+        self.message_user(request, f'{updated} applicant(s) marked as hired.')
+
+    @admin.action(description='Mark selected applicants as rejected')
+    def mark_rejected(self, request, queryset):
+        updated = queryset.mark_status(Applicant.Status.REJECTED)
+        self.message_user(request, f'{updated} applicant(s) marked as rejected.')
+
 
 @admin.register(LeaveRequest)
 class LeaveRequestAdmin(admin.ModelAdmin):
@@ -121,6 +143,12 @@ class LeaveRequestAdmin(admin.ModelAdmin):
     )
 
 
+class PerformanceReviewChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        # The list only shows a few columns, skip loading the feedback text
+        return super().get_queryset(request, exclude_parameters).for_list()
+
+
 @admin.register(PerformanceReview)
 class PerformanceReviewAdmin(admin.ModelAdmin):
     list_display = [
@@ -137,6 +165,9 @@ class PerformanceReviewAdmin(admin.ModelAdmin):
     ordering = ['-review_date', '-created_at']
     date_hierarchy = 'review_date'
 
+    def get_changelist(self, request, **kwargs):
+        return PerformanceReviewChangeList
+
     fieldsets = (
         ('Employee Information', {
             'fields': ('employee_id',)
@@ -216,6 +247,10 @@ class TrainingProgramAdmin(admin.ModelAdmin):
     ordering = ['-start_date', '-created_at']
     date_hierarchy = 'start_date'
 
+    def get_queryset(self, request):
+        # is_ongoing is in list_display, let the database work it out per row
+        return super().get_queryset(request).with_state()
+
     fieldsets = (
         ('Program Information', {
             'fields': ('program_name', 'provider', 'description')
@@ -253,6 +288,10 @@ class AssetAdmin(admin.ModelAdmin):
     list_editable = ['status']
     ordering = ['-created_at']
 
+    def save_model(self, request, obj, form, change):
+        # The admin form has already run full_clean() on the instance
+        obj.save(skip_validation=True)
+
 
 @admin.register(DailyWorkReport)
 class DailyWorkReportAdmin(admin.ModelAdmin):
@@ -262,6 +301,17 @@ class DailyWorkReportAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-day', '-created_at']
     list_editable = ['status']
+    actions = ['mark_approved', 'mark_rejected']
+
+    @admin.action(description='Mark selected reports as approved')
+    def mark_approved(self, request, queryset):
+        updated = queryset.mark_status('approved')
+        self.message_user(request, f'{updated} report(s) marked as approved.')
+
+    @admin.action(description='Mark selected reports as rejected')
+    def mark_rejected(self, request, queryset):
+        updated = queryset.mark_status('rejected')
+        self.message_user(request, f'{updated} report(s) marked as rejected.')
 
 @admin.register(Award)
 class AwardAdmin(admin.ModelAdmin):
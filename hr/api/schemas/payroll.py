@@ -99,3 +99,5 @@ class PayrollFilterSchema(Schema):
     disbursement_date_to: Optional[date] = None
     min_net_salary: Optional[Decimal] = None
     max_net_salary: Optional[Decimal] = None
+    allowance: Optional[str] = None
+    deduction: Optional[str] = None
@@ -30,7 +30,7 @@ def list_applicants(
     stage: Optional[str] = None,
     status: Optional[str] = None,
 ):
-    queryset = Applicant.objects.select_related('job_posting').all()
+    queryset = Applicant.objects.order_by('-created_at', '-id')
 
     # Search functionality
     if search:
@@ -60,10 +60,7 @@ def get_applicant(request, applicant_id: int):
     """
     Get a single applicant by ID.
     """
-    applicant = get_object_or_404(
-        Applicant.objects.select_related('job_posting', 'job_posting__department'),
-        id=applicant_id
-    )
+    applicant = get_object_or_404(Applicant, id=applicant_id)
     return applicant
 
 
@@ -81,8 +78,8 @@ def create_applicant(request, payload: ApplicantCreateSchema):
 
         applicant = Applicant.objects.create(**data)
 
-        # Increment job posting applicants count
-        job_posting.increment_applicants()
+        # Increment job posting applicants count, reloading it for the response
+        job_posting.increment_applicants(refresh=True)
 
         return 201, applicant
     except ValidationError as e:
@@ -107,7 +104,7 @@ def update_applicant(request, applicant_id: int, payload: ApplicantUpdateSchema)
             if old_job_posting.id != new_job_posting.id:
                 # Update counts
                 old_job_posting.decrement_applicants()
-                new_job_posting.increment_applicants()
+                new_job_posting.increment_applicants(refresh=True)
                 applicant.job_posting = new_job_posting
 
         for attr, value in update_data.items():
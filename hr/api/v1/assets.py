@@ -19,10 +19,10 @@ def list_assets(
     asset_type: Optional[str] = None,
     status: Optional[str] = None
 ):
-    qs = Asset.objects.all()
+    qs = Asset.objects.order_by('-created_at', '-id')
 
     if search:
-        qs = qs.filter(Q(name__icontains=search) | Q(asset_id__icontains=search))
+        qs = qs.filter(Q(name__icontains=search) | Q(serial_number__icontains=search))
 
     if branch:
         qs = qs.filter(branch=branch)
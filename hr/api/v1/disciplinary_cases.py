@@ -31,10 +31,13 @@ def list_disciplinary_cases(
     employee_id: str = None,
     action_type: str = None,
     violation_category: str = None,
+    employee_name: str = None,
 ):
     qs = DisciplinaryCase.objects.all()
     if employee_id:
         qs = qs.filter(employee_id=employee_id)
+    if employee_name:
+        qs = qs.filter(employee_name__icontains=employee_name)
     if action_type:
         qs = qs.filter(action_type=action_type)
     if violation_category:
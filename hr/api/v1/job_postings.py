@@ -30,7 +30,7 @@ def list_job_postings(
     department_id: Optional[int] = None,
     is_active: Optional[bool] = None,
 ):
-    queryset = JobPosting.objects.all()
+    queryset = JobPosting.objects.order_by('-created_at', '-id')
 
     # Search functionality
     if search:
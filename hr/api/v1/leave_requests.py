@@ -31,7 +31,7 @@ def list_leave_requests(
     start_date_from: Optional[date] = None,
     start_date_to: Optional[date] = None,
 ):
-    queryset = LeaveRequest.objects.all()
+    queryset = LeaveRequest.objects.order_by('-created_at', '-id')
 
     # Search functionality
     if search:
@@ -55,6 +55,11 @@ def list_payroll(
         payroll_records = payroll_records.filter(net_salary__gte=filters.min_net_salary)
     if filters.max_net_salary:
         payroll_records = payroll_records.filter(net_salary__lte=filters.max_net_salary)
+    # Records that include an allowance/deduction, e.g. allowance=housing
+    if filters.allowance:
+        payroll_records = payroll_records.filter(allowances__has_key=filters.allowance)
+    if filters.deduction:
+        payroll_records = payroll_records.filter(deductions__has_key=filters.deduction)
 
     return payroll_records
 
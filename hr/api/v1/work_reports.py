@@ -5,6 +5,7 @@ from ninja.pagination import paginate, LimitOffsetPagination
 from django.shortcuts import get_object_or_404
 from django.db.models import Q
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 
 from hr.models import DailyWorkReport
 from hr.api.schemas import (
@@ -30,7 +31,7 @@ def list_work_reports(
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
 ):
-    queryset = DailyWorkReport.objects.all()
+    queryset = DailyWorkReport.objects.for_list()
 
     if search:
         queryset = queryset.filter(
@@ -77,6 +78,25 @@ def create_work_report(request, payload: WorkReportCreate):
         return 400, {'detail': e.messages[0]}
 
 
+@router.post('/bulk', response={201: List[WorkReportOut], 400: MessageSchema})
+def bulk_create_work_reports(request, payload: List[WorkReportCreate]):
+    """
+    Create several daily work reports at once.
+
+    Employee IDs are validated together before anything is saved, and the
+    reports are inserted in batches.
+    """
+    try:
+        reports = DailyWorkReport.bulk_create_validated(
+            DailyWorkReport(**item.model_dump()) for item in payload
+        )
+        return 201, reports
+    except ValidationError as e:
+        return 400, {'detail': e.messages[0]}
+    except IntegrityError:
+        return 400, {'detail': 'A work report already exists for this employee and day'}
+
+
 @router.put('/{report_id}', response={200: WorkReportOut, 400: MessageSchema})
 def update_work_report(request, report_id: int, payload: WorkReportUpdate):
     """
@@ -14,11 +14,17 @@ Usage:
     result = department_client.validate_department('123')
 """
 
+from django.conf import settings
+
 from .auth_client import AuthClient
 from .department_client import DepartmentClient
 
+# Deadline in seconds for calls from the shared clients, used by the model
+# validators, so a hung service frees the worker quickly
+VALIDATE_TIMEOUT = getattr(settings, 'GRPC_VALIDATE_TIMEOUT_SEC', 2.0)
+
 # Singleton instances
-auth_client = AuthClient()
-department_client = DepartmentClient()
+auth_client = AuthClient(timeout=VALIDATE_TIMEOUT)
+department_client = DepartmentClient(timeout=VALIDATE_TIMEOUT)
 
 __all__ = ['auth_client', 'department_client', 'AuthClient', 'DepartmentClient']
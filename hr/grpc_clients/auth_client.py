@@ -7,14 +7,67 @@ in the main backend to validate employees, users, and branches.
 
 import logging
 import grpc
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from django.conf import settings
 
 from . import auth_service_pb2
 from . import auth_service_pb2_grpc
+from .channels import HedgePolicy, get_channel, hedged_call
 
 logger = logging.getLogger(__name__)
 
+# Send a second copy of a slow VerifyToken call, so one slow auth server
+# doesn't hold the request for the full timeout
+VERIFY_HEDGE_POLICY = HedgePolicy(
+    delay=getattr(settings, 'AUTH_VERIFY_HEDGING_DELAY', None),
+    ratio=getattr(settings, 'AUTH_VERIFY_HEDGING_RATIO', 0.1),
+)
+
+
+def _employee_result(response) -> Dict:
+    """Convert a ValidateEmployeeResponse into the dict returned by validate_employee()"""
+    employee_data = None
+    if response.employee and response.exists:
+        employee_data = {
+            'id': response.employee.id,
+            'employee_id': response.employee.employee_id,
+            'email': response.employee.email,
+            'full_name': response.employee.full_name,
+            'phone': response.employee.phone,
+            'department_id': response.employee.department_id,
+            'position': response.employee.position,
+            'is_active': response.employee.is_active,
+            'created_at': response.employee.created_at,
+            'updated_at': response.employee.updated_at,
+        }
+
+    return {
+        'exists': response.exists,
+        'employee': employee_data,
+        'message': response.message
+    }
+
+
+def _user_result(response) -> Dict:
+    """Convert a ValidateUserResponse into the dict returned by validate_user()"""
+    user_data = None
+    if response.user and response.exists:
+        user_data = {
+            'id': response.user.id,
+            'email': response.user.email,
+            'full_name': response.user.full_name,
+            'username': response.user.username,
+            'is_active': response.user.is_active,
+            'created_at': response.user.created_at,
+            'updated_at': response.user.updated_at,
+        }
+
+    return {
+        'exists': response.exists,
+        'user': user_data,
+        'message': response.message
+    }
+
 
 class AuthClient:
     """
@@ -33,7 +86,7 @@ class AuthClient:
         self,
         host: Optional[str] = None,
         port: Optional[str] = None,
-        timeout: int = 5
+        timeout: float = 5
     ):
         """
         Initialize the auth gRPC client.
@@ -51,9 +104,9 @@ class AuthClient:
 
     @property
     def channel(self):
-        """Lazy-loaded gRPC channel."""
+        """Lazy-loaded gRPC channel, shared by all clients for the same server."""
         if self._channel is None:
-            self._channel = grpc.insecure_channel(f'{self.host}:{self.port}')
+            self._channel = get_channel(f'{self.host}:{self.port}')
         return self._channel
 
     @property
@@ -64,11 +117,12 @@ class AuthClient:
         return self._stub
 
     def close(self):
-        """Close the gRPC channel."""
-        if self._channel:
-            self._channel.close()
-            self._channel = None
-            self._stub = None
+        """
+        Release the gRPC channel. The channel itself is shared and stays
+        open, see channels.close_channels().
+        """
+        self._channel = None
+        self._stub = None
 
     def __enter__(self):
         return self
@@ -96,7 +150,9 @@ class AuthClient:
         """
         try:
             request = auth_service_pb2.VerifyTokenRequest(token=token)
-            response = self.stub.VerifyToken(request, timeout=self.timeout)
+            response = hedged_call(
+                self.stub.VerifyToken, request, timeout=self.timeout, policy=VERIFY_HEDGE_POLICY
+            )
 
             user_data = None
             if response.user and response.valid:
@@ -147,31 +203,86 @@ class AuthClient:
 
             response = self.stub.ValidateEmployee(request, timeout=self.timeout)
 
-            employee_data = None
-            if response.employee and response.exists:
-                employee_data = {
-                    'id': response.employee.id,
-                    'employee_id': response.employee.employee_id,
-                    'email': response.employee.email,
-                    'full_name': response.employee.full_name,
-                    'phone': response.employee.phone,
-                    'department_id': response.employee.department_id,
-                    'position': response.employee.position,
-                    'is_active': response.employee.is_active,
-                    'created_at': response.employee.created_at,
-                    'updated_at': response.employee.updated_at,
-                }
-
             logger.info(f"Employee validation result for {employee_id}: {response.exists}")
 
+            return _employee_result(response)
+
+        except grpc.RpcError as e:
+            logger.error(f"gRPC error validating employee {employee_id}: {e.code()} - {e.details()}")
+            raise
+
+    def validate_employees(self, employee_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Validate several employee IDs with a single ValidateEmployees call.
+
+        Args:
+            employee_ids: The employee IDs to validate
+
+        Returns:
+            dict: The validate_employee() result for each ID, keyed by ID.
+            IDs the service leaves out are reported as not existing.
+
+        Raises:
+            grpc.RpcError: If the gRPC call fails, UNIMPLEMENTED if the auth
+            service predates ValidateEmployees
+        """
+        try:
+            request = auth_service_pb2.ValidateEmployeesRequest(
+                employee_ids=employee_ids
+            )
+
+            response = self.stub.ValidateEmployees(request, timeout=self.timeout)
+
+            results = {}
+            for employee_id in employee_ids:
+                if employee_id in response.results:
+                    results[employee_id] = _employee_result(response.results[employee_id])
+                else:
+                    results[employee_id] = {'exists': False, 'employee': None, 'message': ''}
+
+            logger.info(f"Validated {len(employee_ids)} employee IDs in one call")
+
+            return results
+
+        except grpc.RpcError as e:
+            logger.error(f"gRPC error validating employees: {e.code()} - {e.details()}")
+            raise
+
+    def validate_employees_each(self, employee_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Validate several employee IDs with concurrent ValidateEmployee calls,
+        for auth services without ValidateEmployees.
+
+        All requests are sent before waiting on any of them, so the batch
+        takes about one round-trip rather than one per ID.
+
+        Args:
+            employee_ids: The employee IDs to validate
+
+        Returns:
+            dict: The validate_employee() result for each ID, keyed by ID
+
+        Raises:
+            grpc.RpcError: If any of the gRPC calls fails
+        """
+        futures = {
+            employee_id: self.stub.ValidateEmployee.future(
+                auth_service_pb2.ValidateEmployeeRequest(employee_id=employee_id),
+                timeout=self.timeout,
+            )
+            for employee_id in employee_ids
+        }
+
+        try:
             return {
-                'exists': response.exists,
-                'employee': employee_data,
-                'message': response.message
+                employee_id: _employee_result(future.result())
+                for employee_id, future in futures.items()
             }
 
         except grpc.RpcError as e:
-            logger.error(f"gRPC error validating employee {employee_id}: {e.code()} - {e.details()}")
+            logger.error(f"gRPC error validating employees: {e.code()} - {e.details()}")
+            for future in futures.values():
+                future.cancel()
             raise
 
     def get_employee(self, employee_id: str) -> Optional[Dict]:
@@ -228,25 +339,9 @@ class AuthClient:
             request = auth_service_pb2.ValidateUserRequest(user_id=user_id)
             response = self.stub.ValidateUser(request, timeout=self.timeout)
 
-            user_data = None
-            if response.user and response.exists:
-                user_data = {
-                    'id': response.user.id,
-                    'email': response.user.email,
-                    'full_name': response.user.full_name,
-                    'username': response.user.username,
-                    'is_active': response.user.is_active,
-                    'created_at': response.user.created_at,
-                    'updated_at': response.user.updated_at,
-                }
-
             logger.info(f"User validation result for {user_id}: {response.exists}")
 
-            return {
-                'exists': response.exists,
-                'user': user_data,
-                'message': response.message
-            }
+            return _user_result(response)
 
         except grpc.RpcError as e:
             logger.error(f"gRPC error validating user {user_id}: {e.code()} - {e.details()}")
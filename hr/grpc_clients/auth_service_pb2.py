@@ -24,13 +24,15 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12\x61uth_service.proto\x12\x04\x61uth\"#\n\x12VerifyTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"`\n\x13VerifyTokenResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\x12\x18\n\x04user\x18\x04 \x01(\x0b\x32\n.auth.User\"&\n\x13ValidateUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"Q\n\x14ValidateUserResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x04user\x18\x03 \x01(\x0b\x32\n.auth.User\"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"#\n\x0fGetUsersRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\"-\n\x10GetUsersResponse\x12\x19\n\x05users\x18\x01 \x03(\x0b\x32\n.auth.User\"\x81\x01\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tfull_name\x18\x03 \x01(\t\x12\x10\n\x08username\x18\x04 \x01(\t\x12\x11\n\tis_active\x18\x05 \x01(\x08\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x12\n\nupdated_at\x18\x07 \x01(\t\".\n\x17ValidateEmployeeRequest\x12\x13\n\x0b\x65mployee_id\x18\x01 \x01(\t\"]\n\x18ValidateEmployeeResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12 \n\x08\x65mployee\x18\x03 \x01(\x0b\x32\x0e.auth.Employee\")\n\x12GetEmployeeRequest\x12\x13\n\x0b\x65mployee_id\x18\x01 \x01(\t\"\xc0\x01\n\x08\x45mployee\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x65mployee_id\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x11\n\tfull_name\x18\x04 \x01(\t\x12\r\n\x05phone\x18\x05 \x01(\t\x12\x15\n\rdepartment_id\x18\x06 \x01(\t\x12\x10\n\x08position\x18\x07 \x01(\t\x12\x11\n\tis_active\x18\x08 \x01(\x08\x12\x12\n\ncreated_at\x18\t \x01(\t\x12\x12\n\nupdated_at\x18\n \x01(\t\"*\n\x15ValidateBranchRequest\x12\x11\n\tbranch_id\x18\x01 \x01(\t\"W\n\x16ValidateBranchResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1c\n\x06\x62ranch\x18\x03 \x01(\x0b\x32\x0c.auth.Branch\"%\n\x10GetBranchRequest\x12\x11\n\tbranch_id\x18\x01 \x01(\t\"\xcb\x01\n\x06\x42ranch\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tbranch_id\x18\x02 \x01(\t\x12\x13\n\x0b\x62ranch_name\x18\x03 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x04 \x01(\t\x12\r\n\x05state\x18\x05 \x01(\t\x12\x16\n\x0eoffice_address\x18\x06 \x01(\t\x12\x1a\n\x12operational_status\x18\x07 \x01(\t\x12\x11\n\tis_active\x18\x08 \x01(\x08\x12\x12\n\ncreated_at\x18\t \x01(\t\x12\x12\n\nupdated_at\x18\n \x01(\t2\x8c\x04\n\x0b\x41uthService\x12\x42\n\x0bVerifyToken\x12\x18.auth.VerifyTokenRequest\x1a\x19.auth.VerifyTokenResponse\x12\x45\n\x0cValidateUser\x12\x19.auth.ValidateUserRequest\x1a\x1a.auth.ValidateUserResponse\x12+\n\x07GetUser\x12\x14.auth.GetUserRequest\x1a\n.auth.User\x12\x39\n\x08GetUsers\x12\x15.auth.GetUsersRequest\x1a\x16.auth.GetUsersResponse\x12Q\n\x10ValidateEmployee\x12\x1d.auth.ValidateEmployeeRequest\x1a\x1e.auth.ValidateEmployeeResponse\x12\x37\n\x0bGetEmployee\x12\x18.auth.GetEmployeeRequest\x1a\x0e.auth.Employee\x12K\n\x0eValidateBranch\x12\x1b.auth.ValidateBranchRequest\x1a\x1c.auth.ValidateBranchResponse\x12\x31\n\tGetBranch\x12\x16.auth.GetBranchRequest\x1a\x0c.auth.Branchb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12\x61uth_service.proto\x12\x04\x61uth\"#\n\x12VerifyTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"`\n\x13VerifyTokenResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\x12\x18\n\x04user\x18\x04 \x01(\x0b\x32\n.auth.User\"&\n\x13ValidateUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"Q\n\x14ValidateUserResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x18\n\x04user\x18\x03 \x01(\x0b\x32\n.auth.User\"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"#\n\x0fGetUsersRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\"-\n\x10GetUsersResponse\x12\x19\n\x05users\x18\x01 \x03(\x0b\x32\n.auth.User\"\x81\x01\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tfull_name\x18\x03 \x01(\t\x12\x10\n\x08username\x18\x04 \x01(\t\x12\x11\n\tis_active\x18\x05 \x01(\x08\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x12\n\nupdated_at\x18\x07 \x01(\t\".\n\x17ValidateEmployeeRequest\x12\x13\n\x0b\x65mployee_id\x18\x01 \x01(\t\"]\n\x18ValidateEmployeeResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12 \n\x08\x65mployee\x18\x03 \x01(\x0b\x32\x0e.auth.Employee\"0\n\x18ValidateEmployeesRequest\x12\x14\n\x0c\x65mployee_ids\x18\x01 \x03(\t\"\xaa\x01\n\x19ValidateEmployeesResponse\x12=\n\x07results\x18\x01 \x03(\x0b\x32,.auth.ValidateEmployeesResponse.ResultsEntry\x1aN\n\x0cResultsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12-\n\x05value\x18\x02 \x01(\x0b\x32\x1e.auth.ValidateEmployeeResponse:\x02\x38\x01\")\n\x12GetEmployeeRequest\x12\x13\n\x0b\x65mployee_id\x18\x01 \x01(\t\"\xc0\x01\n\x08\x45mployee\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x65mployee_id\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x11\n\tfull_name\x18\x04 \x01(\t\x12\r\n\x05phone\x18\x05 \x01(\t\x12\x15\n\rdepartment_id\x18\x06 \x01(\t\x12\x10\n\x08position\x18\x07 \x01(\t\x12\x11\n\tis_active\x18\x08 \x01(\x08\x12\x12\n\ncreated_at\x18\t \x01(\t\x12\x12\n\nupdated_at\x18\n \x01(\t\"*\n\x15ValidateBranchRequest\x12\x11\n\tbranch_id\x18\x01 \x01(\t\"W\n\x16ValidateBranchResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1c\n\x06\x62ranch\x18\x03 \x01(\x0b\x32\x0c.auth.Branch\"%\n\x10GetBranchRequest\x12\x11\n\tbranch_id\x18\x01 \x01(\t\"\xcb\x01\n\x06\x42ranch\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tbranch_id\x18\x02 \x01(\t\x12\x13\n\x0b\x62ranch_name\x18\x03 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x04 \x01(\t\x12\r\n\x05state\x18\x05 \x01(\t\x12\x16\n\x0eoffice_address\x18\x06 \x01(\t\x12\x1a\n\x12operational_status\x18\x07 \x01(\t\x12\x11\n\tis_active\x18\x08 \x01(\x08\x12\x12\n\ncreated_at\x18\t \x01(\t\x12\x12\n\nupdated_at\x18\n \x01(\t2\xe2\x04\n\x0b\x41uthService\x12\x42\n\x0bVerifyToken\x12\x18.auth.VerifyTokenRequest\x1a\x19.auth.VerifyTokenResponse\x12\x45\n\x0cValidateUser\x12\x19.auth.ValidateUserRequest\x1a\x1a.auth.ValidateUserResponse\x12+\n\x07GetUser\x12\x14.auth.GetUserRequest\x1a\n.auth.User\x12\x39\n\x08GetUsers\x12\x15.auth.GetUsersRequest\x1a\x16.auth.GetUsersResponse\x12Q\n\x10ValidateEmployee\x12\x1d.auth.ValidateEmployeeRequest\x1a\x1e.auth.ValidateEmployeeResponse\x12T\n\x11ValidateEmployees\x12\x1e.auth.ValidateEmployeesRequest\x1a\x1f.auth.ValidateEmployeesResponse\x12\x37\n\x0bGetEmployee\x12\x18.auth.GetEmployeeRequest\x1a\x0e.auth.Employee\x12K\n\x0eValidateBranch\x12\x1b.auth.ValidateBranchRequest\x1a\x1c.auth.ValidateBranchResponse\x12\x31\n\tGetBranch\x12\x16.auth.GetBranchRequest\x1a\x0c.auth.Branchb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'auth_service_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_VALIDATEEMPLOYEESRESPONSE_RESULTSENTRY']._loaded_options = None
+  _globals['_VALIDATEEMPLOYEESRESPONSE_RESULTSENTRY']._serialized_options = b'8\001'
   _globals['_VERIFYTOKENREQUEST']._serialized_start=28
   _globals['_VERIFYTOKENREQUEST']._serialized_end=63
   _globals['_VERIFYTOKENRESPONSE']._serialized_start=65
@@ -51,18 +53,24 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_VALIDATEEMPLOYEEREQUEST']._serialized_end=583
   _globals['_VALIDATEEMPLOYEERESPONSE']._serialized_start=585
   _globals['_VALIDATEEMPLOYEERESPONSE']._serialized_end=678
-  _globals['_GETEMPLOYEEREQUEST']._serialized_start=680
-  _globals['_GETEMPLOYEEREQUEST']._serialized_end=721
-  _globals['_EMPLOYEE']._serialized_start=724
-  _globals['_EMPLOYEE']._serialized_end=916
-  _globals['_VALIDATEBRANCHREQUEST']._serialized_start=918
-  _globals['_VALIDATEBRANCHREQUEST']._serialized_end=960
-  _globals['_VALIDATEBRANCHRESPONSE']._serialized_start=962
-  _globals['_VALIDATEBRANCHRESPONSE']._serialized_end=1049
-  _globals['_GETBRANCHREQUEST']._serialized_start=1051
-  _globals['_GETBRANCHREQUEST']._serialized_end=1088
-  _globals['_BRANCH']._serialized_start=1091
-  _globals['_BRANCH']._serialized_end=1294
-  _globals['_AUTHSERVICE']._serialized_start=1297
-  _globals['_AUTHSERVICE']._serialized_end=1821
+  _globals['_VALIDATEEMPLOYEESREQUEST']._serialized_start=680
+  _globals['_VALIDATEEMPLOYEESREQUEST']._serialized_end=728
+  _globals['_VALIDATEEMPLOYEESRESPONSE']._serialized_start=731
+  _globals['_VALIDATEEMPLOYEESRESPONSE']._serialized_end=901
+  _globals['_VALIDATEEMPLOYEESRESPONSE_RESULTSENTRY']._serialized_start=823
+  _globals['_VALIDATEEMPLOYEESRESPONSE_RESULTSENTRY']._serialized_end=901
+  _globals['_GETEMPLOYEEREQUEST']._serialized_start=903
+  _globals['_GETEMPLOYEEREQUEST']._serialized_end=944
+  _globals['_EMPLOYEE']._serialized_start=947
+  _globals['_EMPLOYEE']._serialized_end=1139
+  _globals['_VALIDATEBRANCHREQUEST']._serialized_start=1141
+  _globals['_VALIDATEBRANCHREQUEST']._serialized_end=1183
+  _globals['_VALIDATEBRANCHRESPONSE']._serialized_start=1185
+  _globals['_VALIDATEBRANCHRESPONSE']._serialized_end=1272
+  _globals['_GETBRANCHREQUEST']._serialized_start=1274
+  _globals['_GETBRANCHREQUEST']._serialized_end=1311
+  _globals['_BRANCH']._serialized_start=1314
+  _globals['_BRANCH']._serialized_end=1517
+  _globals['_AUTHSERVICE']._serialized_start=1520
+  _globals['_AUTHSERVICE']._serialized_end=2130
 # @@protoc_insertion_point(module_scope)
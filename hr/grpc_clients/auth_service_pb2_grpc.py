@@ -60,6 +60,11 @@ class AuthServiceStub(object):
                 request_serializer=auth__service__pb2.ValidateEmployeeRequest.SerializeToString,
                 response_deserializer=auth__service__pb2.ValidateEmployeeResponse.FromString,
                 _registered_method=True)
+        self.ValidateEmployees = channel.unary_unary(
+                '/auth.AuthService/ValidateEmployees',
+                request_serializer=auth__service__pb2.ValidateEmployeesRequest.SerializeToString,
+                response_deserializer=auth__service__pb2.ValidateEmployeesResponse.FromString,
+                _registered_method=True)
         self.GetEmployee = channel.unary_unary(
                 '/auth.AuthService/GetEmployee',
                 request_serializer=auth__service__pb2.GetEmployeeRequest.SerializeToString,
@@ -116,6 +121,13 @@ class AuthServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ValidateEmployees(self, request, context):
+        """Validate several employee IDs in one call
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetEmployee(self, request, context):
         """Get employee details
         """
@@ -165,6 +177,11 @@ def add_AuthServiceServicer_to_server(servicer, server):
                     request_deserializer=auth__service__pb2.ValidateEmployeeRequest.FromString,
                     response_serializer=auth__service__pb2.ValidateEmployeeResponse.SerializeToString,
             ),
+            'ValidateEmployees': grpc.unary_unary_rpc_method_handler(
+                    servicer.ValidateEmployees,
+                    request_deserializer=auth__service__pb2.ValidateEmployeesRequest.FromString,
+                    response_serializer=auth__service__pb2.ValidateEmployeesResponse.SerializeToString,
+            ),
             'GetEmployee': grpc.unary_unary_rpc_method_handler(
                     servicer.GetEmployee,
                     request_deserializer=auth__service__pb2.GetEmployeeRequest.FromString,
@@ -327,6 +344,33 @@ class AuthService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ValidateEmployees(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/auth.AuthService/ValidateEmployees',
+            auth__service__pb2.ValidateEmployeesRequest.SerializeToString,
+            auth__service__pb2.ValidateEmployeesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetEmployee(request,
             target,
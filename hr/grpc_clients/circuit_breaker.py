@@ -0,0 +1,83 @@
+"""
+Circuit breaker for gRPC calls
+
+After fail_max consecutive calls fail because a service is unreachable, the
+circuit opens and further calls fail immediately with CircuitOpenError
+instead of each waiting for its own timeout. Once reset_timeout seconds
+have passed a single trial call is let through: success closes the circuit,
+another failure keeps it open for a further reset_timeout.
+"""
+
+import threading
+import time
+import grpc
+
+# Codes meaning the service couldn't answer, as opposed to a real answer
+FAILURE_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit is open."""
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, fail_max: int = 10, reset_timeout: float = 30):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call func unless the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            grpc.RpcError: If the call fails
+        """
+        self._before_call()
+
+        try:
+            result = func(*args, **kwargs)
+        except grpc.RpcError as e:
+            self._record_error(e)
+            raise
+
+        self._record_success()
+        return result
+
+    def _before_call(self):
+        with self._lock:
+            if self._opened_at is not None:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"{self.name} service is unavailable")
+                # Let this call through as a trial, others keep failing fast
+                self._opened_at = time.monotonic()
+
+    def _record_error(self, e: grpc.RpcError):
+        if e.code() in FAILURE_CODES:
+            self._record_failure()
+        else:
+            # Any other status, e.g. NOT_FOUND, is a real answer from the service
+            self._record_success()
+
+    def _record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+    def _record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
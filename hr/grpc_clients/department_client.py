@@ -12,6 +12,7 @@ from django.conf import settings
 
 from . import department_service_pb2
 from . import department_service_pb2_grpc
+from .channels import get_channel
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ class DepartmentClient:
         self,
         host: Optional[str] = None,
         port: Optional[str] = None,
-        timeout: int = 5
+        timeout: float = 5
     ):
         """
         Initialize the department gRPC client.
@@ -49,9 +50,9 @@ class DepartmentClient:
 
     @property
     def channel(self):
-        """Lazy-loaded gRPC channel."""
+        """Lazy-loaded gRPC channel, shared by all clients for the same server."""
         if self._channel is None:
-            self._channel = grpc.insecure_channel(f'{self.host}:{self.port}')
+            self._channel = get_channel(f'{self.host}:{self.port}')
         return self._channel
 
     @property
@@ -62,11 +63,12 @@ class DepartmentClient:
         return self._stub
 
     def close(self):
-        """Close the gRPC channel."""
-        if self._channel:
-            self._channel.close()
-            self._channel = None
-            self._stub = None
+        """
+        Release the gRPC channel. The channel itself is shared and stays
+        open, see channels.close_channels().
+        """
+        self._channel = None
+        self._stub = None
 
     def __enter__(self):
         return self
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0021_delete_associate"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(
+                fields=["status", "-created_at"], name="assets_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0022_asset_assets_status_created_idx"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="applicant",
+            options={"verbose_name": "Applicant", "verbose_name_plural": "Applicants"},
+        ),
+        migrations.AlterModelOptions(
+            name="asset",
+            options={"verbose_name": "Asset", "verbose_name_plural": "Assets"},
+        ),
+        migrations.AlterModelOptions(
+            name="jobposting",
+            options={
+                "verbose_name": "Job Posting",
+                "verbose_name_plural": "Job Postings",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="leaverequest",
+            options={
+                "verbose_name": "Leave Request",
+                "verbose_name_plural": "Leave Requests",
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0023_remove_default_created_at_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="asset",
+            name="documents",
+            field=models.URLField(
+                blank=True,
+                help_text="URL of the uploaded invoice, warranty, manual, etc.",
+                max_length=512,
+                null=True,
+            ),
+        ),
+    ]
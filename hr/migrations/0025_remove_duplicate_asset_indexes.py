@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0024_alter_asset_documents"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="asset",
+            name="assigned_to_id",
+            field=models.CharField(
+                blank=True,
+                help_text="Employee ID from main auth service",
+                max_length=50,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="asset",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("in_use", "In Use"),
+                    ("maintenance", "Maintenance"),
+                    ("available", "Available"),
+                    ("retired", "Retired"),
+                    ("lost_stolen", "Lost/Stolen"),
+                ],
+                default="available",
+                max_length=50,
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0025_remove_duplicate_asset_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="applicant",
+            index=models.Index(
+                condition=models.Q(("status__in", ["new", "in_review", "shortlisted"])),
+                fields=["-created_at"],
+                name="applicants_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(
+                condition=models.Q(("status", "in_use")),
+                fields=["-created_at"],
+                name="assets_in_use_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0026_add_active_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["status", "deadline"],
+                name="jobposting_active_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="leaverequest",
+            index=models.Index(
+                fields=["status", "-start_date"], name="leave_status_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payroll",
+            index=models.Index(
+                fields=["status", "-disbursement_date"], name="payroll_status_disb_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Keeps payroll.net_salary in sync on PostgreSQL for writes that bypass
+# Payroll.save() (QuerySet.update, bulk_create, raw SQL)
+
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION payroll_net_salary() RETURNS trigger AS $$
+BEGIN
+    NEW.net_salary := NEW.gross_salary
+        + (SELECT COALESCE(SUM(NULLIF(value, '')::numeric), 0)
+           FROM jsonb_each_text(COALESCE(NEW.allowances, '{}'::jsonb)))
+        - (SELECT COALESCE(SUM(NULLIF(value, '')::numeric), 0)
+           FROM jsonb_each_text(COALESCE(NEW.deductions, '{}'::jsonb)));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS payroll_net_salary_trg ON payroll;
+CREATE TRIGGER payroll_net_salary_trg
+    BEFORE INSERT OR UPDATE OF gross_salary, allowances, deductions, net_salary
+    ON payroll
+    FOR EACH ROW EXECUTE FUNCTION payroll_net_salary();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS payroll_net_salary_trg ON payroll;
+DROP FUNCTION IF EXISTS payroll_net_salary();
+"""
+
+
+def create_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_TRIGGER)
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_TRIGGER)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0027_add_status_date_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
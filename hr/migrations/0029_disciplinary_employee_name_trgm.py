@@ -0,0 +1,42 @@
+# Trigram index for substring search on disciplinary_cases.employee_name.
+# On PostgreSQL, employee_name__icontains compiles to
+# UPPER("employee_name"::text) LIKE UPPER(%s), which the planner can only
+# serve from an index on that same expression.
+# PostgreSQL only; built CONCURRENTLY so it doesn't block writes.
+
+from django.db import migrations
+
+CREATE_EXTENSION = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+CREATE_INDEX = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS disciplinary_employee_name_trgm
+    ON disciplinary_cases USING GIN ((UPPER(employee_name::text)) gin_trgm_ops)
+"""
+
+DROP_INDEX = "DROP INDEX CONCURRENTLY IF EXISTS disciplinary_employee_name_trgm"
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        # Run separately, a multi-statement query is an implicit transaction
+        schema_editor.execute(CREATE_EXTENSION)
+        schema_editor.execute(CREATE_INDEX)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("hr", "0028_payroll_net_salary_trigger"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
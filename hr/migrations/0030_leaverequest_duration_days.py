@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:33
+
+import django.db.models.expressions
+import hr.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0029_disciplinary_employee_name_trgm"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="leaverequest",
+            name="duration_days",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    hr.models.expressions.DaysBetween("end_date", "start_date"),
+                    "+",
+                    models.Value(1),
+                ),
+                output_field=models.IntegerField(),
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0030_leaverequest_duration_days"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="disciplinarycase",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("action_date__gte", models.F("date_of_violation"))),
+                name="disciplinary_action_after_violation",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="disciplinarycase",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("severance_payment_due", False),
+                    models.Q(
+                        ("severance_amount__gt", 0), ("severance_amount__isnull", False)
+                    ),
+                    _connector="OR",
+                ),
+                name="disciplinary_severance_amount_when_due",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="disciplinarycase",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("severance_payment_due", True),
+                    ("severance_amount__isnull", True),
+                    ("severance_amount", 0),
+                    _connector="OR",
+                ),
+                name="disciplinary_severance_due_when_amount",
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0031_disciplinarycase_check_constraints"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="disciplinarycase",
+            name="disciplinar_date_of_1ba10a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="payroll",
+            name="payroll_disburs_20cb89_idx",
+        ),
+        migrations.AddIndex(
+            model_name="disciplinarycase",
+            index=models.Index(
+                fields=["-date_of_violation", "-created_at"],
+                name="disciplinary_violation_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="jobposting_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="leaverequest",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="leave_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payroll",
+            index=models.Index(
+                fields=["-disbursement_date", "-created_at"],
+                name="payroll_disb_created_idx",
+            ),
+        ),
+    ]
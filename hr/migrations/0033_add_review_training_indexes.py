@@ -0,0 +1,38 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0032_add_created_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="performancereview",
+            name="performance_employe_90c87e_idx",
+        ),
+        migrations.AddIndex(
+            model_name="performancereview",
+            index=models.Index(
+                fields=["-review_date", "-created_at"], name="reviews_date_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="performancereview",
+            index=models.Index(
+                fields=["employee_id", "-review_date", "-created_at"],
+                name="reviews_employee_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trainingprogram",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "in_progress"])),
+                fields=["-start_date"],
+                name="training_active_idx",
+            ),
+        ),
+    ]
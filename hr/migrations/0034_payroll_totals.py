@@ -0,0 +1,100 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:39
+
+from decimal import Decimal
+from django.db import migrations, models
+
+JSONB_SUM_SQL = "(SELECT COALESCE(SUM(NULLIF(value, '')::numeric), 0) FROM jsonb_each_text(COALESCE({column}, '{{}}'::jsonb)))"
+
+BACKFILL_SQL = f"""
+UPDATE payroll SET
+    total_allowances = {JSONB_SUM_SQL.format(column='allowances')},
+    total_deductions = {JSONB_SUM_SQL.format(column='deductions')}
+"""
+
+# Same as 0028_payroll_net_salary_trigger, now also keeping the totals in sync
+CREATE_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION payroll_net_salary() RETURNS trigger AS $$
+BEGIN
+    NEW.total_allowances := {JSONB_SUM_SQL.format(column='NEW.allowances')};
+    NEW.total_deductions := {JSONB_SUM_SQL.format(column='NEW.deductions')};
+    NEW.net_salary := NEW.gross_salary + NEW.total_allowances - NEW.total_deductions;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS payroll_net_salary_trg ON payroll;
+CREATE TRIGGER payroll_net_salary_trg
+    BEFORE INSERT OR UPDATE OF gross_salary, allowances, deductions, net_salary,
+        total_allowances, total_deductions
+    ON payroll
+    FOR EACH ROW EXECUTE FUNCTION payroll_net_salary();
+"""
+
+PREVIOUS_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION payroll_net_salary() RETURNS trigger AS $$
+BEGIN
+    NEW.net_salary := NEW.gross_salary
+        + {JSONB_SUM_SQL.format(column='NEW.allowances')}
+        - {JSONB_SUM_SQL.format(column='NEW.deductions')};
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS payroll_net_salary_trg ON payroll;
+CREATE TRIGGER payroll_net_salary_trg
+    BEFORE INSERT OR UPDATE OF gross_salary, allowances, deductions, net_salary
+    ON payroll
+    FOR EACH ROW EXECUTE FUNCTION payroll_net_salary();
+"""
+
+
+def sum_amounts(amounts):
+    if not amounts:
+        return Decimal("0.00")
+    return sum((Decimal(str(v)) for v in amounts.values() if v), Decimal("0.00"))
+
+
+def backfill_totals(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(BACKFILL_SQL)
+        schema_editor.execute(CREATE_TRIGGER)
+        return
+
+    Payroll = apps.get_model("hr", "Payroll")
+    payrolls = list(Payroll.objects.only("id", "allowances", "deductions"))
+    for payroll in payrolls:
+        payroll.total_allowances = sum_amounts(payroll.allowances)
+        payroll.total_deductions = sum_amounts(payroll.deductions)
+    Payroll.objects.bulk_update(
+        payrolls, ["total_allowances", "total_deductions"], batch_size=1000
+    )
+
+
+def restore_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(PREVIOUS_TRIGGER)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0033_add_review_training_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="payroll",
+            name="total_allowances",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="payroll",
+            name="total_deductions",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), editable=False, max_digits=12
+            ),
+        ),
+        migrations.RunPython(backfill_totals, restore_trigger),
+    ]
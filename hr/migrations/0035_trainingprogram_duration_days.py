@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:43
+
+import django.db.models.expressions
+import hr.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0034_payroll_totals"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trainingprogram",
+            name="duration_days",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    hr.models.expressions.DaysBetween("end_date", "start_date"),
+                    "+",
+                    models.Value(1),
+                ),
+                output_field=models.IntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trainingprogram",
+            index=models.Index(fields=["duration_days"], name="training_duration_idx"),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# GIN indexes on the payroll allowance/deduction breakdowns, so key and
+# containment lookups (has_key, contains) don't scan the whole table.
+# PostgreSQL only; built CONCURRENTLY so they don't block writes.
+
+from django.db import migrations
+
+CREATE_INDEXES = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS payroll_allowances_gin ON payroll USING GIN (allowances)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS payroll_deductions_gin ON payroll USING GIN (deductions)",
+]
+
+DROP_INDEXES = [
+    "DROP INDEX CONCURRENTLY IF EXISTS payroll_allowances_gin",
+    "DROP INDEX CONCURRENTLY IF EXISTS payroll_deductions_gin",
+]
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for sql in CREATE_INDEXES:
+            schema_editor.execute(sql)
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        for sql in DROP_INDEXES:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("hr", "0035_trainingprogram_duration_days"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0036_payroll_breakdown_gin"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="dailyworkreport",
+            name="daily_work__status_15865d_idx",
+        ),
+        migrations.AlterField(
+            model_name="dailyworkreport",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("draft", "Draft"),
+                    ("submitted", "Submitted"),
+                    ("approved", "Approved"),
+                    ("rejected", "Rejected"),
+                ],
+                default="draft",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dailyworkreport",
+            index=models.Index(fields=["status", "day"], name="dwr_status_day_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="dailyworkreport",
+            index=models.Index(
+                fields=["employee_id", "status", "day"], name="dwr_emp_status_day_idx"
+            ),
+        ),
+    ]
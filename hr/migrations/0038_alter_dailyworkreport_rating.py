@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:47
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0037_dailyworkreport_status_day_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dailyworkreport",
+            name="rating",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(1),
+                    django.core.validators.MaxValueValidator(5),
+                ],
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:47
+
+import django.core.validators
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0038_alter_dailyworkreport_rating"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dailyworkreport",
+            name="hours_worked",
+            field=models.DecimalField(
+                decimal_places=1,
+                default=Decimal("0.0"),
+                help_text="Total hours worked for the day",
+                max_digits=4,
+                validators=[
+                    django.core.validators.MinValueValidator(Decimal("0.0")),
+                    django.core.validators.MaxValueValidator(Decimal("24.0")),
+                ],
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="dailyworkreport",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("hours_worked__gte", 0), ("hours_worked__lte", 24)),
+                name="dwr_hours_range",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="dailyworkreport",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("rating__isnull", True),
+                    models.Q(("rating__gte", 1), ("rating__lte", 5)),
+                    _connector="OR",
+                ),
+                name="dwr_rating_range",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0039_dailyworkreport_check_constraints"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="dailyworkreport",
+            name="daily_work__employe_4c3bd3_idx",
+        ),
+        migrations.AddIndex(
+            model_name="dailyworkreport",
+            index=models.Index(fields=["-day", "-created_at"], name="dwr_feed_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="dailyworkreport",
+            index=models.Index(
+                fields=["employee_id", "-day"], name="dwr_emp_day_desc_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 23:19
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr", "0040_dailyworkreport_feed_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="asset",
+            name="assets_status_326766_idx",
+        ),
+    ]
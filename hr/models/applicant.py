@@ -1,9 +1,24 @@
-from django.db import models, IntegrityError, transaction
+from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
 from .base import BaseModel
 from .job_posting import JobPosting
-import random
-import string
+
+
+class ApplicantQuerySet(models.QuerySet):
+    def mark_stage(self, stage):
+        """Move every applicant in the queryset to a stage with a single UPDATE"""
+        return self.update(stage=stage, updated_at=timezone.now())
+
+    def mark_status(self, status):
+        """Set the status of every applicant in the queryset with a single UPDATE"""
+        return self.update(status=status, updated_at=timezone.now())
+
+
+class ApplicantManager(models.Manager.from_queryset(ApplicantQuerySet)):
+    def get_queryset(self):
+        # __str__ and the API schemas read the job posting title, so always join it
+        return super().get_queryset().select_related('job_posting')
 
 
 class Applicant(BaseModel):
@@ -56,15 +71,22 @@ class Applicant(BaseModel):
     linkedin_url = models.URLField(blank=True, null=True)
     portolio_url = models.URLField(blank=True, null=True)
 
+    objects = ApplicantManager()
+
     class Meta:
         db_table = 'applicants'
-        ordering = ['-created_at']
         verbose_name = 'Applicant'
         verbose_name_plural = 'Applicants'
         indexes = [
             models.Index(fields=['email']),
             models.Index(fields=['stage']),
             models.Index(fields=['status']),
+            # Most list queries only look at applicants still in the pipeline
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(status__in=['new', 'in_review', 'shortlisted']),
+                name='applicants_active_idx',
+            ),
         ]
 
     def __str__(self):
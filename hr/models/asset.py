@@ -2,10 +2,11 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from decimal import Decimal
-from .base import BaseModel
-from hr.utils.validators import validate_employee_id, validate_department_id
+from .base import BaseModel, BulkCreateValidatedMixin
+from hr.utils.validators import validate_employee_id, validate_department_id, validate_references
 
-class Asset(BaseModel):
+
+class Asset(BulkCreateValidatedMixin, BaseModel):
     """Model for company assets"""
 
     ASSET_TYPE_CHOICES = [
@@ -25,6 +26,9 @@ class Asset(BaseModel):
         ('lost_stolen', 'Lost/Stolen'),
     ]
 
+    # Assets are assigned to employees, other references are departments
+    employee_id_fields = ('assigned_to_id',)
+
     name = models.CharField(max_length=255, help_text="Name of the asset")
     asset_type = models.CharField(
         max_length=50,
@@ -43,7 +47,6 @@ class Asset(BaseModel):
         max_length=50,
         blank=True,
         null=True,
-        db_index=True,
         help_text="Employee ID from main auth service"
     )
     department_id = models.CharField(
@@ -70,29 +73,34 @@ class Asset(BaseModel):
     status = models.CharField(
         max_length=50,
         choices=STATUS_CHOICES,
-        default='available',
-        db_index=True
+        default='available'
     )
     warranty_expiry_date = models.DateField(blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
 
     # Documents
     documents = models.URLField(
+        max_length=512,
         blank=True,
         null=True,
-        help_text="Upload invoice, warranty, manual, etc."
+        help_text="URL of the uploaded invoice, warranty, manual, etc."
     )
 
     class Meta:
         db_table = 'assets'
-        ordering = ['-created_at']
         verbose_name = 'Asset'
         verbose_name_plural = 'Assets'
         indexes = [
-            models.Index(fields=['status']),
             models.Index(fields=['asset_type']),
             models.Index(fields=['branch']),
             models.Index(fields=['assigned_to_id']),
+            # Matches the list endpoint: filter by status, newest first
+            models.Index(fields=['status', '-created_at'], name='assets_status_created_idx'),
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(status='in_use'),
+                name='assets_in_use_idx',
+            ),
         ]
 
     def __str__(self):
@@ -103,22 +111,17 @@ class Asset(BaseModel):
         Validate cross-service references before saving.
         """
         super().clean()
-        errors = {}
+        checks = {}
 
-        # Validate assigned_to_id (optional field)
-        if self.assigned_to_id:
-            try:
-                employee_info = validate_employee_id(self.assigned_to_id)
-            except ValidationError as e:
-                errors['assigned_to_id'] = e.message
+        # Validate assigned_to_id (optional field), unchanged ids were already validated
+        if self.assigned_to_id and self.field_changed('assigned_to_id'):
+            checks['assigned_to_id'] = (validate_employee_id, self.assigned_to_id)
 
         # Validate department_id (optional field)
-        if self.department_id:
-            try:
-                validate_department_id(self.department_id)
-            except ValidationError as e:
-                errors['department_id'] = e.message
+        if self.department_id and self.field_changed('department_id'):
+            checks['department_id'] = (validate_department_id, self.department_id)
 
+        errors = validate_references(checks)
         if errors:
             raise ValidationError(errors)
 
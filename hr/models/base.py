@@ -1,9 +1,157 @@
+import copy
+from functools import lru_cache
+from django.conf import settings
 from django.db import models
+from django.utils.encoding import force_str
+from django.utils.hashable import make_hashable
+from hr.utils.validators import validate_employee_ids_bulk
 
 
-class BaseModel(models.Model):
+def _snapshot(value):
+    # JSON values are mutable, copy them so in-place edits still count as changes
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _choice_labels(field):
+    # Choices are fixed once the model class is built, so map them once per field
+    return dict(make_hashable(field.flatchoices))
+
+
+class ChoiceLabelsMixin:
+    """
+    Faster get_FOO_display() for models with choice fields.
+
+    Relies on a Django internal: every get_FOO_display() method is a
+    partialmethod of Model._get_FIELD_display(field), which is private and
+    rebuilds a dict from field.flatchoices on each call. Check this override
+    still matches that method's behavior when upgrading Django.
+    """
+
+    def _get_FIELD_display(self, field):
+        value = getattr(self, field.attname)
+        return force_str(
+            _choice_labels(field).get(make_hashable(value), value), strings_only=True
+        )
+
+
+class BaseModel(ChoiceLabelsMixin, models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Keep the loaded values so we can tell which fields were changed
+        instance._loaded_values = {
+            name: _snapshot(value) for name, value in zip(field_names, values)
+        }
+        return instance
+
+    def field_changed(self, field_name):
+        """Return True if the field differs from the value loaded from the database"""
+        loaded_values = getattr(self, '_loaded_values', None)
+        if self._state.adding or not loaded_values or field_name not in loaded_values:
+            return True
+        return getattr(self, field_name) != loaded_values[field_name]
+
+    def full_clean_for_save(self, update_fields=None, **kwargs):
+        """
+        Run full_clean() before saving, only checking update_fields when the
+        save is limited to them.
+        """
+        exclude = None
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            exclude = [
+                field.name for field in self._meta.concrete_fields
+                if field.name not in update_fields and field.attname not in update_fields
+            ]
+        self.full_clean(exclude=exclude, **kwargs)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        fields = self._meta.concrete_fields
+        update_fields = kwargs.get('update_fields')
+        loaded_values = {}
+        if update_fields is not None:
+            # Only these fields were written, others keep the loaded value
+            update_fields = set(update_fields)
+            fields = [
+                field for field in fields
+                if field.name in update_fields or field.attname in update_fields
+            ]
+            loaded_values = dict(getattr(self, '_loaded_values', None) or {})
+
+        loaded_values.update({
+            field.attname: _snapshot(self.__dict__[field.attname])
+            for field in fields
+            if field.attname in self.__dict__
+        })
+        self._loaded_values = loaded_values
+
+
+class BulkCreateValidatedMixin:
+    """
+    Bulk insert path for models that validate employee IDs in save().
+
+    All employee IDs in the batch are validated up front, which also warms
+    the validator cache so each object's clean() doesn't call the auth
+    service again. Rows are then inserted with bulk_create, so save() is not
+    called and no signals are sent.
+    """
+
+    # Fields holding employee IDs from the auth service
+    employee_id_fields = ('employee_id',)
+
+    # For bulk_upsert(): the unique fields identifying an existing row, and
+    # the fields overwritten when one is found
+    upsert_unique_fields = ()
+    upsert_update_fields = ()
+
+    @classmethod
+    def validate_for_bulk(cls, objs):
+        """Validate unsaved objects the way save() would, checking employee IDs in one pass"""
+        validate_employee_ids_bulk({
+            getattr(obj, field)
+            for obj in objs
+            for field in cls.employee_id_fields
+            if getattr(obj, field)
+        })
+
+        for obj in objs:
+            # Uniqueness and check constraints are left to the database
+            obj.full_clean(validate_unique=False, validate_constraints=False)
+
+    @classmethod
+    def bulk_create_validated(cls, objs, batch_size=None):
+        batch_size = batch_size or getattr(settings, 'HR_BULK_CREATE_BATCH_SIZE', 1000)
+        objs = list(objs)
+        cls.validate_for_bulk(objs)
+        return cls.objects.bulk_create(objs, batch_size=batch_size)
+
+    @classmethod
+    def bulk_upsert(cls, objs, batch_size=None):
+        """
+        Validate and insert objects, updating the existing row instead when one
+        matches upsert_unique_fields, e.g. when re-running an import.
+        """
+        if not cls.upsert_unique_fields:
+            raise TypeError(f"{cls.__name__} does not define upsert_unique_fields")
+
+        batch_size = batch_size or getattr(settings, 'HR_BULK_CREATE_BATCH_SIZE', 1000)
+        objs = list(objs)
+        cls.validate_for_bulk(objs)
+        return cls.objects.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=list(cls.upsert_unique_fields),
+            update_fields=list(cls.upsert_update_fields),
+        )
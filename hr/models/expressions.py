@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class DaysBetween(models.Func):
+    """
+    Number of days from start to end, i.e. end - start for two date columns.
+
+    Deterministic on each backend, so it can be used in a GeneratedField.
+    """
+
+    arity = 2
+    output_field = models.IntegerField()
+
+    def __init__(self, end, start, **extra):
+        super().__init__(end, start, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        # PostgreSQL: date - date is an integer number of days
+        return super().as_sql(
+            compiler, connection, template='(%(expressions)s)', arg_joiner=' - ', **extra_context
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template='CAST(julianday(%(expressions)s) AS INTEGER)',
+            arg_joiner=') - julianday(',
+            **extra_context,
+        )
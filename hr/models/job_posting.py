@@ -1,10 +1,11 @@
 from django.db import models
+from django.db.models import F
 from django.core.exceptions import ValidationError
-from .base import BaseModel
-from hr.utils.validators import validate_department_id, validate_branch_id
+from .base import BaseModel, BulkCreateValidatedMixin
+from hr.utils.validators import validate_department_id, validate_branch_id, validate_references
 
 
-class JobPosting(BaseModel):
+class JobPosting(BulkCreateValidatedMixin, BaseModel):
     """
     Model for managing job postings in the HR system.
     """
@@ -23,6 +24,9 @@ class JobPosting(BaseModel):
         CLOSED = 'closed', 'Closed'
         CANCELLED = 'cancelled', 'Cancelled'
 
+    # Job postings reference departments and branches, not employees
+    employee_id_fields = ()
+
     job_title = models.CharField(max_length=255)
     department_id = models.CharField(
         max_length=255,
@@ -52,9 +56,18 @@ class JobPosting(BaseModel):
 
     class Meta:
         db_table = 'job_postings'
-        ordering = ['-created_at']
         verbose_name = 'Job Posting'
         verbose_name_plural = 'Job Postings'
+        indexes = [
+            # Newest first, id breaks ties so pagination is stable
+            models.Index(fields=['-created_at', '-id'], name='jobposting_created_id_idx'),
+            # Open postings by status and closing date
+            models.Index(
+                fields=['status', 'deadline'],
+                condition=models.Q(is_active=True),
+                name='jobposting_active_deadline_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.job_title} - {self.department_id}"
@@ -62,38 +75,40 @@ class JobPosting(BaseModel):
     def clean(self):
         """Validate cross-service references before saving."""
         super().clean()
-        errors = {}
+        checks = {}
 
         # Validate department_id (optional field)
         if self.department_id:
-            try:
-                validate_department_id(self.department_id)
-            except ValidationError as e:
-                errors['department_id'] = e.message
+            checks['department_id'] = (validate_department_id, self.department_id)
 
         # Validate branch_id (required field)
         if self.branch_id:
-            try:
-                validate_branch_id(self.branch_id)
-            except ValidationError as e:
-                errors['branch_id'] = e.message
+            checks['branch_id'] = (validate_branch_id, self.branch_id)
 
+        errors = validate_references(checks)
         if errors:
             raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
         """Override save to ensure validation happens."""
         if not kwargs.pop('skip_validation', False):
-            self.full_clean()
+            # The only unique field is the auto-assigned id, so skip the extra
+            # SELECT that validate_unique would run
+            self.full_clean(validate_unique=False)
         super().save(*args, **kwargs)
 
-    def increment_applicants(self):
-        """Increment the applicants count"""
-        self.applicants_count += 1
-        self.save(update_fields=['applicants_count'])
+    def increment_applicants(self, refresh=False):
+        """Increment the applicants count in a single atomic UPDATE"""
+        JobPosting.objects.filter(pk=self.pk).update(
+            applicants_count=F('applicants_count') + 1
+        )
+        if refresh:
+            self.refresh_from_db(fields=['applicants_count'])
 
-    def decrement_applicants(self):
-        """Decrement the applicants count"""
-        if self.applicants_count > 0:
-            self.applicants_count -= 1
-            self.save(update_fields=['applicants_count'])
+    def decrement_applicants(self, refresh=False):
+        """Decrement the applicants count in a single atomic UPDATE, never below zero"""
+        JobPosting.objects.filter(pk=self.pk, applicants_count__gt=0).update(
+            applicants_count=F('applicants_count') - 1
+        )
+        if refresh:
+            self.refresh_from_db(fields=['applicants_count'])
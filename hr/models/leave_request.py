@@ -1,45 +1,50 @@
 from django.db import models
 from django.core.exceptions import ValidationError
-from .base import BaseModel
-from hr.utils.validators import validate_employee_id
+from .base import BaseModel, BulkCreateValidatedMixin
+from .expressions import DaysBetween
+from hr.utils.validators import validate_employee_ids_bulk
 
 
-class LeaveRequest(BaseModel):
+class LeaveRequest(BulkCreateValidatedMixin, BaseModel):
     """Model for employee leave requests"""
 
-    # Leave Type Choices
-    LEAVE_TYPE_CHOICES = [
-        ('sick_leave', 'Sick Leave'),
-        ('annual_leave', 'Annual Leave'),
-        ('casual_leave', 'Casual Leave'),
-        ('maternity_leave', 'Maternity Leave'),
-        ('paternity_leave', 'Paternity Leave'),
-        ('unpaid_leave', 'Unpaid Leave'),
-        ('compassionate_leave', 'Compassionate Leave'),
-    ]
-
-    # Status Choices
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('approved', 'Approved'),
-        ('rejected', 'Rejected'),
-        ('cancelled', 'Cancelled'),
-    ]
+    class LeaveType(models.TextChoices):
+        SICK_LEAVE = 'sick_leave', 'Sick Leave'
+        ANNUAL_LEAVE = 'annual_leave', 'Annual Leave'
+        CASUAL_LEAVE = 'casual_leave', 'Casual Leave'
+        MATERNITY_LEAVE = 'maternity_leave', 'Maternity Leave'
+        PATERNITY_LEAVE = 'paternity_leave', 'Paternity Leave'
+        UNPAID_LEAVE = 'unpaid_leave', 'Unpaid Leave'
+        COMPASSIONATE_LEAVE = 'compassionate_leave', 'Compassionate Leave'
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        APPROVED = 'approved', 'Approved'
+        REJECTED = 'rejected', 'Rejected'
+        CANCELLED = 'cancelled', 'Cancelled'
+
+    employee_id_fields = ('employee_id', 'approver_id')
 
     # Employee Information
     employee_id = models.CharField(max_length=50, db_index=True)
 
     # Leave Details
-    leave_type = models.CharField(max_length=50, choices=LEAVE_TYPE_CHOICES)
+    leave_type = models.CharField(max_length=50, choices=LeaveType.choices)
     start_date = models.DateField()
     end_date = models.DateField()
     reason = models.TextField()
+    # Inclusive day count, computed by the database so it can be aggregated
+    duration_days = models.GeneratedField(
+        expression=DaysBetween('end_date', 'start_date') + 1,
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
 
     # Status
     status = models.CharField(
         max_length=20,
-        choices=STATUS_CHOICES,
-        default='pending',
+        choices=Status.choices,
+        default=Status.PENDING,
         db_index=True
     )
 
@@ -50,24 +55,19 @@ class LeaveRequest(BaseModel):
 
     class Meta:
         db_table = 'leave_requests'
-        ordering = ['-created_at']
         verbose_name = 'Leave Request'
         verbose_name_plural = 'Leave Requests'
         indexes = [
             models.Index(fields=['employee_id', 'status']),
             models.Index(fields=['start_date', 'end_date']),
+            models.Index(fields=['status', '-start_date'], name='leave_status_start_idx'),
+            # Newest first, id breaks ties so pagination is stable
+            models.Index(fields=['-created_at', '-id'], name='leave_created_id_idx'),
         ]
 
     def __str__(self):
         return f"{self.leave_type} ({self.start_date} to {self.end_date})"
 
-    @property
-    def duration_days(self):
-        """Calculate the number of days for the leave request"""
-        if self.start_date and self.end_date:
-            return (self.end_date - self.start_date).days + 1
-        return 0
-
     def clean(self):
         """
         Validate cross-service references before saving.
@@ -75,20 +75,12 @@ class LeaveRequest(BaseModel):
         """
         super().clean()
 
-        # Validate employee_id
-        if self.employee_id:
-            try:
-                validate_employee_id(self.employee_id)
-            except ValidationError as e:
-                raise ValidationError(e.message)
-                
-        # Validate approver_id (optional field)
-        if self.approver_id:
-            try:
-                validate_employee_id(self.approver_id)
-            except ValidationError as e:
-                raise ValidationError(e.message)
-                
+        # Validate employee_id and approver_id (optional field) in one pass,
+        # so an ID used for both is only looked up once
+        employee_ids = dict.fromkeys(
+            employee_id for employee_id in (self.employee_id, self.approver_id) if employee_id
+        )
+        validate_employee_ids_bulk(employee_ids)
 
         # Validate date logic
         if self.start_date and self.end_date:
@@ -102,6 +94,16 @@ class LeaveRequest(BaseModel):
         """
         # Skip validation if explicitly requested (for data migrations, etc.)
         if not kwargs.pop('skip_validation', False):
-            self.full_clean()
+            # The only unique field is the auto-assigned id, so skip the extra
+            # SELECT that validate_unique would run
+            self.full_clean(validate_unique=False)
 
+        dates_changed = not self._state.adding and (
+            self.field_changed('start_date') or self.field_changed('end_date')
+        )
         super().save(*args, **kwargs)
+
+        # Inserts return duration_days, updates don't. Drop the stale value
+        # so it's loaded from the database on next access.
+        if dates_changed:
+            self.__dict__.pop('duration_days', None)
@@ -1,12 +1,26 @@
-from django.db import models
+from django.db import IntegrityError, connections, models
+from django.db.models import F
+from django.db.models.expressions import RawSQL
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from decimal import Decimal
-from .base import BaseModel
+from .base import BaseModel, BulkCreateValidatedMixin
 from hr.utils.validators import validate_employee_id
 
 
-class Payroll(BaseModel):
+# Sum of a JSONB breakdown column, matching _sum_amounts (PostgreSQL only)
+_JSONB_SUM_SQL = "(SELECT COALESCE(SUM(NULLIF(value, '')::numeric), 0) FROM jsonb_each_text({column}))"
+
+
+def _sum_amounts(amounts):
+    """Sum a JSON breakdown of amounts as Decimal, without going through float"""
+    if not amounts:
+        return Decimal('0.00')
+    return sum((Decimal(str(v)) for v in amounts.values() if v), Decimal('0.00'))
+
+
+class Payroll(BulkCreateValidatedMixin, BaseModel):
     """Model for employee payroll records"""
 
     # Status Choices
@@ -17,6 +31,19 @@ class Payroll(BaseModel):
         ('cancelled', 'Cancelled'),
     ]
 
+    # Fields that update_totals() reads or writes
+    TOTALS_FIELDS = (
+        'gross_salary', 'allowances', 'deductions',
+        'total_allowances', 'total_deductions', 'net_salary',
+    )
+
+    # Re-importing a period updates the employee's existing record
+    upsert_unique_fields = ('employee_id', 'payroll_period')
+    upsert_update_fields = (
+        'gross_salary', 'allowances', 'deductions', 'total_allowances',
+        'total_deductions', 'net_salary', 'disbursement_date', 'status', 'updated_at',
+    )
+
     # Employee Information
     employee_id = models.CharField(max_length=50, db_index=True)
 
@@ -47,6 +74,20 @@ class Payroll(BaseModel):
         help_text="Deductions breakdown as key-value pairs"
     )
 
+    # Totals of the breakdowns above, stored so they can be aggregated in SQL
+    total_allowances = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        editable=False
+    )
+    total_deductions = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        editable=False
+    )
+
     # Calculated Salary
     net_salary = models.DecimalField(
         max_digits=12,
@@ -72,8 +113,10 @@ class Payroll(BaseModel):
         verbose_name_plural = 'Payroll Records'
         indexes = [
             models.Index(fields=['employee_id', 'payroll_period']),
-            models.Index(fields=['disbursement_date']),
+            # Matches the default ordering
+            models.Index(fields=['-disbursement_date', '-created_at'], name='payroll_disb_created_idx'),
             models.Index(fields=['status']),
+            models.Index(fields=['status', '-disbursement_date'], name='payroll_status_disb_idx'),
         ]
         # Ensure one payroll record per employee per period
         unique_together = [['employee_id', 'payroll_period']]
@@ -81,25 +124,68 @@ class Payroll(BaseModel):
     def __str__(self):
         return f"{self.payroll_period} (Net: {self.net_salary})"
 
-    @property
-    def total_allowances(self):
-        """Calculate total allowances"""
-        if not self.allowances:
-            return Decimal('0.00')
-        return Decimal(str(sum(float(v) for v in self.allowances.values() if v)))
-
-    @property
-    def total_deductions(self):
-        """Calculate total deductions"""
-        if not self.deductions:
-            return Decimal('0.00')
-        return Decimal(str(sum(float(v) for v in self.deductions.values() if v)))
-
     def calculate_net_salary(self):
         """Calculate net salary based on gross salary, allowances, and deductions"""
-        total_allowances = self.total_allowances
-        total_deductions = self.total_deductions
-        return self.gross_salary + total_allowances - total_deductions
+        return self.gross_salary + _sum_amounts(self.allowances) - _sum_amounts(self.deductions)
+
+    def update_totals(self):
+        """Recalculate total allowances, total deductions and net salary from the breakdowns"""
+        self.total_allowances = _sum_amounts(self.allowances)
+        self.total_deductions = _sum_amounts(self.deductions)
+        self.net_salary = self.gross_salary + self.total_allowances - self.total_deductions
+
+    @classmethod
+    def recompute_all(cls, queryset=None):
+        """
+        Recalculate net salary for every record in queryset (default: all).
+
+        On PostgreSQL this is a single UPDATE that sums the JSON breakdowns in
+        the database; other backends recalculate in Python and bulk_update.
+        Returns the number of records updated.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+
+        if connections[queryset.db].vendor == 'postgresql':
+            allowances = RawSQL(
+                _JSONB_SUM_SQL.format(column='allowances'), [], output_field=models.DecimalField()
+            )
+            deductions = RawSQL(
+                _JSONB_SUM_SQL.format(column='deductions'), [], output_field=models.DecimalField()
+            )
+            return queryset.update(
+                total_allowances=allowances,
+                total_deductions=deductions,
+                net_salary=F('gross_salary') + allowances - deductions,
+                updated_at=timezone.now(),
+            )
+
+        payrolls = list(queryset.only('id', 'gross_salary', 'allowances', 'deductions'))
+        now = timezone.now()
+        for payroll in payrolls:
+            payroll.update_totals()
+            payroll.updated_at = now
+        return cls.objects.bulk_update(
+            payrolls,
+            ['total_allowances', 'total_deductions', 'net_salary', 'updated_at'],
+            batch_size=1000,
+        )
+
+    @classmethod
+    def bulk_create_validated(cls, objs, batch_size=None):
+        """Bulk insert payroll records, calculating totals since save() is skipped"""
+        objs = list(objs)
+        for obj in objs:
+            obj.update_totals()
+        return super().bulk_create_validated(objs, batch_size=batch_size)
+
+    @classmethod
+    def bulk_upsert(cls, objs, batch_size=None):
+        """Insert or update payroll records by employee and period, calculating totals first"""
+        objs = list(objs)
+        for obj in objs:
+            obj.update_totals()
+        return super().bulk_upsert(objs, batch_size=batch_size)
 
     def clean(self):
         super().clean()
@@ -114,8 +200,23 @@ class Payroll(BaseModel):
         """Override save to validate and auto-calculate net salary"""
         # Validate employee_id unless explicitly skipped
         if not kwargs.pop('skip_validation', False):
-            self.full_clean()
-
-        # Auto-calculate net salary before saving
-        self.net_salary = self.calculate_net_salary()
-        super().save(*args, **kwargs)
+            # Uniqueness is enforced by the database, see below
+            self.full_clean(validate_unique=False)
+
+        # Auto-calculate totals and net salary before saving, unless neither
+        # they nor their inputs changed (e.g. a status update). On PostgreSQL
+        # the payroll_net_salary trigger computes the same values for writes
+        # that skip save(); setting them here keeps the instance in sync.
+        if any(self.field_changed(field) for field in self.TOTALS_FIELDS):
+            self.update_totals()
+
+        try:
+            super().save(*args, **kwargs)
+        except IntegrityError as e:
+            # Both SQLite and PostgreSQL name the columns of the violated
+            # (employee_id, payroll_period) unique constraint in the message
+            if 'payroll_period' in str(e):
+                raise ValidationError(
+                    'Payroll record already exists for this employee and period'
+                ) from e
+            raise
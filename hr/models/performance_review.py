@@ -1,11 +1,24 @@
+from asgiref.sync import sync_to_async
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
-from .base import BaseModel
-from hr.utils.validators import validate_employee_id
+from .base import BaseModel, BulkCreateValidatedMixin
+from hr.utils.validators import validate_employee_ids_bulk, avalidate_employee_ids
 
 
-class PerformanceReview(BaseModel):
+class PerformanceReviewQuerySet(models.QuerySet):
+    def for_list(self):
+        """
+        Load only the columns shown in review listings, leaving out the long
+        feedback text fields. Use the full queryset for a single review.
+        """
+        return self.only(
+            'id', 'employee_id', 'reviewer_id', 'review_date', 'review_period',
+            'overall_rating', 'created_at', 'updated_at',
+        )
+
+
+class PerformanceReview(BulkCreateValidatedMixin, BaseModel):
     """Model for employee performance reviews"""
 
     # Rating Choices (1-5 stars)
@@ -23,6 +36,9 @@ class PerformanceReview(BaseModel):
         ('q3', 'Q3'),
         ('q4', 'Q4')
     ]
+
+    employee_id_fields = ('employee_id', 'reviewer_id')
+
     # Employee Information
     employee_id = models.CharField(max_length=50, db_index=True)
 
@@ -60,13 +76,20 @@ class PerformanceReview(BaseModel):
         help_text="Additional feedback and comments"
     )
 
+    objects = PerformanceReviewQuerySet.as_manager()
+
     class Meta:
         db_table = 'performance_reviews'
         ordering = ['-review_date', '-created_at']
         verbose_name = 'Performance Review'
         verbose_name_plural = 'Performance Reviews'
         indexes = [
-            models.Index(fields=['employee_id', 'review_date']),
+            # Match the default ordering, overall and per employee
+            models.Index(fields=['-review_date', '-created_at'], name='reviews_date_created_idx'),
+            models.Index(
+                fields=['employee_id', '-review_date', '-created_at'],
+                name='reviews_employee_date_idx',
+            ),
             models.Index(fields=['reviewer_id', 'review_date']),
             models.Index(fields=['review_period']),
         ]
@@ -87,17 +110,8 @@ class PerformanceReview(BaseModel):
         """
         super().clean()
 
-        if self.employee_id:
-            try:
-                reviewer_info = validate_employee_id(self.employee_id)
-            except ValidationError as e:
-                raise ValidationError(e.message)
-        
-        if self.reviewer_id:
-            try:
-                reviewer_info = validate_employee_id(self.reviewer_id)
-            except ValidationError as e:
-                raise ValidationError(e.message)
+        # Validate employee_id and reviewer_id in one pass, unchanged ids were already validated
+        validate_employee_ids_bulk(self._changed_employee_ids())
 
         # Validate that reviewer is not the same as employee
         if self.employee_id and self.reviewer_id and self.employee_id == self.reviewer_id:
@@ -108,6 +122,28 @@ class PerformanceReview(BaseModel):
         Override save to ensure validation happens.
         """
         if not kwargs.pop('skip_validation', False):
-            self.full_clean()
+            self.full_clean_for_save(kwargs.get('update_fields'))
 
         super().save(*args, **kwargs)
+
+    def _changed_employee_ids(self):
+        return [
+            getattr(self, field) for field in self.employee_id_fields
+            if getattr(self, field) and self.field_changed(field)
+        ]
+
+    async def aclean(self):
+        """
+        Async clean() for async views. Employee IDs are validated in one bulk
+        lookup first, so clean() itself is served from the validator cache.
+        """
+        await avalidate_employee_ids(self._changed_employee_ids())
+        await sync_to_async(self.clean)()
+
+    async def asave(self, *args, **kwargs):
+        """
+        Async save() that validates employee IDs in one bulk lookup before saving.
+        """
+        if not kwargs.get('skip_validation', False):
+            await avalidate_employee_ids(self._changed_employee_ids())
+        await super().asave(*args, **kwargs)
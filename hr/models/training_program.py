@@ -1,7 +1,35 @@
+from datetime import date
 from django.db import models
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 from .base import BaseModel
+from .expressions import DaysBetween
+
+
+class TrainingProgramQuerySet(models.QuerySet):
+    def with_state(self, today=None):
+        """
+        Annotate each program with state ('ongoing', 'upcoming' or None), so
+        is_ongoing/is_upcoming are worked out by the database in one pass.
+        """
+        today = today or date.today()
+        return self.annotate(
+            state=models.Case(
+                models.When(
+                    start_date__lte=today,
+                    end_date__gte=today,
+                    status='in_progress',
+                    then=models.Value('ongoing'),
+                ),
+                models.When(
+                    start_date__gt=today,
+                    status='pending',
+                    then=models.Value('upcoming'),
+                ),
+                default=None,
+                output_field=models.CharField(),
+            )
+        )
 
 
 class TrainingProgram(BaseModel):
@@ -40,6 +68,12 @@ class TrainingProgram(BaseModel):
     # Dates
     start_date = models.DateField()
     end_date = models.DateField()
+    # Inclusive of both start and end date
+    duration_days = models.GeneratedField(
+        expression=DaysBetween('end_date', 'start_date') + 1,
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
 
     # Financial
     cost = models.DecimalField(
@@ -64,6 +98,8 @@ class TrainingProgram(BaseModel):
         db_index=True
     )
 
+    objects = TrainingProgramQuerySet.as_manager()
+
     class Meta:
         db_table = 'training_programs'
         ordering = ['-start_date', '-created_at']
@@ -73,28 +109,41 @@ class TrainingProgram(BaseModel):
             models.Index(fields=['program_name', 'start_date']),
             models.Index(fields=['status', 'start_date']),
             models.Index(fields=['target_audience']),
+            models.Index(fields=['duration_days'], name='training_duration_idx'),
+            # Programs still to run or running, as shown on dashboards
+            models.Index(
+                fields=['-start_date'],
+                condition=models.Q(status__in=['pending', 'in_progress']),
+                name='training_active_idx',
+            ),
         ]
 
     def __str__(self):
         return f"{self.program_name} - {self.start_date} to {self.end_date}"
 
-    @property
-    def duration_days(self):
-        """Calculate the duration of the training program in days"""
-        if self.start_date and self.end_date:
-            return (self.end_date - self.start_date).days + 1
-        return 0
+    def save(self, *args, **kwargs):
+        dates_changed = not self._state.adding and (
+            self.field_changed('start_date') or self.field_changed('end_date')
+        )
+        super().save(*args, **kwargs)
+
+        # Inserts return duration_days, updates don't. Drop the stale value
+        # so it's loaded from the database on next access.
+        if dates_changed:
+            self.__dict__.pop('duration_days', None)
 
     @property
     def is_ongoing(self):
         """Check if the training program is currently ongoing"""
-        from datetime import date
+        if 'state' in self.__dict__:
+            return self.state == 'ongoing'
         today = date.today()
         return self.start_date <= today <= self.end_date and self.status == 'in_progress'
 
     @property
     def is_upcoming(self):
         """Check if the training program is upcoming"""
-        from datetime import date
+        if 'state' in self.__dict__:
+            return self.state == 'upcoming'
         today = date.today()
         return self.start_date > today and self.status == 'pending'
@@ -1,12 +1,29 @@
 from django.db import models
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from decimal import Decimal
 from django.core.validators import MinValueValidator
-from .base import BaseModel
+from .base import BaseModel, BulkCreateValidatedMixin
 from hr.utils.validators import validate_employee_id
 from django.core.validators import MinValueValidator, MaxValueValidator
 
-class DailyWorkReport(BaseModel):
+class DailyWorkReportQuerySet(models.QuerySet):
+    def for_list(self):
+        """
+        Load only the columns shown in report listings, leaving out the long
+        text fields. Use the full queryset for a single report.
+        """
+        return self.only(
+            'id', 'employee_id', 'day', 'hours_worked', 'mood', 'rating',
+            'feedback', 'status', 'created_at', 'updated_at',
+        )
+
+    def mark_status(self, status):
+        """Set the status of every report in the queryset with a single UPDATE"""
+        return self.update(status=status, updated_at=timezone.now())
+
+
+class DailyWorkReport(BulkCreateValidatedMixin, BaseModel):
     """Model for tracking daily work reports from employees"""
 
     MOOD_CHOICES = [
@@ -25,6 +42,13 @@ class DailyWorkReport(BaseModel):
         ('rejected', 'Rejected'),
     ]
 
+    # One report per employee per day, re-submitting updates it
+    upsert_unique_fields = ('employee_id', 'day')
+    upsert_update_fields = (
+        'hours_worked', 'mood', 'challenges', 'achievements', 'plan_next_day',
+        'rating', 'feedback', 'status', 'updated_at',
+    )
+
     # Employee Information (employee_id references main backend Employee)
     employee_id = models.CharField(max_length=50, db_index=True, default='', help_text="Employee ID from main backend")
 
@@ -33,7 +57,7 @@ class DailyWorkReport(BaseModel):
     hours_worked = models.DecimalField(
         max_digits=4,
         decimal_places=1,
-        validators=[MinValueValidator(Decimal('0.0'))],
+        validators=[MinValueValidator(Decimal('0.0')), MaxValueValidator(Decimal('24.0'))],
         default=Decimal('0.0'),
         help_text="Total hours worked for the day"
     )
@@ -48,9 +72,7 @@ class DailyWorkReport(BaseModel):
     achievements = models.TextField(blank=True, null=True, help_text="Accomplishments today")
     plan_next_day = models.TextField(blank=True, null=True, help_text="Plan for tomorrow")
 
-    rating = models.DecimalField(
-        max_digits=1,
-        decimal_places=0,
+    rating = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         validators=[MinValueValidator(1), MaxValueValidator(5)],
@@ -62,24 +84,50 @@ class DailyWorkReport(BaseModel):
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
-        default='draft',
-        db_index=True
+        default='draft'
     )
 
+    objects = DailyWorkReportQuerySet.as_manager()
+
     class Meta:
         db_table = 'daily_work_reports'
         ordering = ['-day', '-created_at']
         verbose_name = 'Daily Work Report'
         verbose_name_plural = 'Daily Work Reports'
         indexes = [
-            models.Index(fields=['employee_id', 'day']),
-            models.Index(fields=['status']),
+            # Match the default ordering, overall and per employee (an employee
+            # has one report per day, so day alone orders their reports)
+            models.Index(fields=['-day', '-created_at'], name='dwr_feed_idx'),
+            models.Index(fields=['employee_id', '-day'], name='dwr_emp_day_desc_idx'),
+            # Reports by status over a date range, overall and per employee.
+            # These also serve plain status lookups.
+            models.Index(fields=['status', 'day'], name='dwr_status_day_idx'),
+            models.Index(fields=['employee_id', 'status', 'day'], name='dwr_emp_status_day_idx'),
         ]
         unique_together = ['employee_id', 'day']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(hours_worked__gte=0, hours_worked__lte=24),
+                name='dwr_hours_range',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(rating__isnull=True) | models.Q(rating__gte=1, rating__lte=5),
+                name='dwr_rating_range',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.employee_id} - {self.day}"
 
+    @classmethod
+    def transition_status(cls, pk, status):
+        """
+        Move a report to a new status (e.g. submitted to approved) with a
+        single UPDATE, without loading it or re-validating the employee.
+        Returns True if the report exists.
+        """
+        return cls.objects.filter(pk=pk).mark_status(status) > 0
+
     def clean(self):
         """
         Validate cross-service references before saving.
@@ -87,8 +135,8 @@ class DailyWorkReport(BaseModel):
         super().clean()
         errors = {}
 
-        # Validate employee_id
-        if self.employee_id:
+        # Validate employee_id, an unchanged id was already validated
+        if self.employee_id and self.field_changed('employee_id'):
             try:
                 employee_info = validate_employee_id(self.employee_id)                
             except ValidationError as e:
@@ -101,7 +149,10 @@ class DailyWorkReport(BaseModel):
         """
         Override save to ensure validation happens.
         """
+        # Skip validation if explicitly requested, the check constraints still apply
         if not kwargs.pop('skip_validation', False):
-            self.full_clean()
+            # The field validators cover the check constraints, so skip the
+            # queries that would verify them
+            self.full_clean_for_save(kwargs.get('update_fields'), validate_constraints=False)
 
         super().save(*args, **kwargs)
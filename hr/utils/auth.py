@@ -9,7 +9,7 @@ from typing import Optional, Any
 from ninja.security import HttpBearer
 from django.http import HttpRequest
 
-from .auth_client import get_auth_client, AuthClient
+from .auth_client import get_auth_client, extract_bearer_token, verify_token_for_request, AuthClient
 
 
 class AuthBearer(HttpBearer):
@@ -40,8 +40,7 @@ class AuthBearer(HttpBearer):
         Returns:
             user_id if valid, None otherwise
         """
-        client = get_auth_client()
-        is_valid, user_id = client.verify_token(token)
+        is_valid, user_id = verify_token_for_request(request, token)
 
         if is_valid and user_id:
             # Store user_id in request for later use
@@ -90,8 +89,7 @@ class OptionalAuthBearer(HttpBearer):
         if not token:
             return None
 
-        client = get_auth_client()
-        is_valid, user_id = client.verify_token(token)
+        is_valid, user_id = verify_token_for_request(request, token)
 
         if is_valid and user_id:
             request.user_id = user_id
@@ -107,10 +105,7 @@ optional_auth = OptionalAuthBearer()
 
 def get_token_from_request(request: HttpRequest) -> Optional[str]:
     """Extract bearer token from request headers."""
-    auth_header = request.headers.get('Authorization', '')
-    if auth_header.startswith('Bearer '):
-        return auth_header[7:]
-    return None
+    return extract_bearer_token(request)
 
 
 def require_auth(request: HttpRequest) -> tuple[bool, Optional[int], str]:
@@ -124,8 +119,7 @@ def require_auth(request: HttpRequest) -> tuple[bool, Optional[int], str]:
     if not token:
         return False, None, "Authorization header required"
 
-    client = get_auth_client()
-    is_valid, user_id = client.verify_token(token)
+    is_valid, user_id = verify_token_for_request(request, token)
 
     if not is_valid:
         return False, None, "Invalid or expired token"
@@ -22,15 +22,64 @@ Usage:
     employee_info = client.get_employee_info(employee_id)
 """
 
+import hashlib
 import logging
+import random
+import threading
+import time
 from typing import Tuple, Optional, Dict, Any
 from django.conf import settings
+from django.core.cache import cache
 
 from hr.grpc_clients.auth_client import AuthClient as GrpcAuthClient
+from hr.grpc_clients.circuit_breaker import CircuitBreaker, CircuitOpenError
 import grpc
+import jwt
+
+from .jwt_verifier import verify_token_locally
 
 logger = logging.getLogger(__name__)
 
+# How long (in seconds) a successful token verification is reused. Never
+# longer than the token itself is valid for.
+TOKEN_CACHE_TIMEOUT = getattr(settings, 'AUTH_VERIFY_CACHE_TTL', 30)
+# Rejected tokens are kept for a short, randomised time so a flood of bad
+# tokens can't all reach the auth service, and their entries don't all
+# expire at the same moment.
+TOKEN_NEGATIVE_CACHE_TIMEOUT = getattr(settings, 'AUTH_VERIFY_NEGATIVE_CACHE_TTL', 3)
+
+# Shared by all AuthClients in the process, so once the auth service is
+# down requests fail fast instead of each waiting out the gRPC timeout
+_verify_breaker = CircuitBreaker(
+    'Auth',
+    fail_max=getattr(settings, 'AUTH_CIRCUIT_FAIL_MAX', 10),
+    reset_timeout=getattr(settings, 'AUTH_CIRCUIT_RESET_TIMEOUT', 30),
+)
+
+
+def _negative_cache_timeout() -> int:
+    """Seconds to cache a rejected token, 0 when negative caching is off"""
+    if TOKEN_NEGATIVE_CACHE_TIMEOUT <= 1:
+        return max(TOKEN_NEGATIVE_CACHE_TIMEOUT, 0)
+    return random.randint(1, TOKEN_NEGATIVE_CACHE_TIMEOUT)
+
+
+def _token_cache_key(token: str) -> str:
+    # Hash the token so raw credentials never end up in the cache
+    return f"verify_token:{hashlib.sha256(token.encode()).hexdigest()[:32]}"
+
+
+def _token_cache_timeout(token: str) -> int:
+    """Seconds a verified token may be cached, capped at its exp claim."""
+    try:
+        # The auth service has already checked the signature
+        exp = jwt.decode(token, options={'verify_signature': False}).get('exp')
+    except jwt.InvalidTokenError:
+        exp = None
+    if exp is None:
+        return TOKEN_CACHE_TIMEOUT
+    return max(0, min(TOKEN_CACHE_TIMEOUT, int(exp - time.time())))
+
 
 class AuthClientError(Exception):
     """Exception raised when auth client operations fail."""
@@ -89,6 +138,28 @@ class AuthClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    def _verify(self, token: str) -> Dict:
+        """
+        Verify a token with the auth service, reusing a recent result for
+        the same token.
+
+        Raises:
+            grpc.RpcError: If the gRPC call fails
+            CircuitOpenError: If the auth service is known to be down
+        """
+        key = _token_cache_key(token)
+        result = cache.get(key)
+        if result is None:
+            # Errors raise and are never stored
+            result = _verify_breaker.call(self.grpc_client.verify_token, token)
+            if result.get('valid'):
+                timeout = _token_cache_timeout(token)
+            else:
+                timeout = _negative_cache_timeout()
+            if timeout:
+                cache.set(key, result, timeout)
+        return result
+
     def verify_token(self, token: str) -> Tuple[bool, Optional[int]]:
         """
         Verify a JWT token with the auth service using gRPC.
@@ -99,8 +170,13 @@ class AuthClient:
         Returns:
             Tuple of (is_valid, user_id). user_id is None if invalid.
         """
+        # Check the signature in-process when the auth service's keys are available
+        local_result = verify_token_locally(token)
+        if local_result is not None:
+            return local_result
+
         try:
-            result = self.grpc_client.verify_token(token)
+            result = self._verify(token)
             is_valid = result.get('valid', False)
             user_id = result.get('user_id')
 
@@ -117,6 +193,9 @@ class AuthClient:
         except grpc.RpcError as e:
             logger.error(f"gRPC error verifying token: {e.code()} - {e.details()}")
             return False, None
+        except CircuitOpenError as e:
+            logger.warning(f"Skipped verifying token: {str(e)}")
+            return False, None
         except Exception as e:
             logger.error(f"Unexpected error verifying token: {str(e)}")
             return False, None
@@ -132,7 +211,7 @@ class AuthClient:
             Tuple of (success, user_data, message)
         """
         try:
-            result = self.grpc_client.verify_token(token)
+            result = self._verify(token)
             is_valid = result.get('valid', False)
 
             if is_valid:
@@ -148,6 +227,9 @@ class AuthClient:
         except grpc.RpcError as e:
             logger.error(f"gRPC error getting current user: {e.code()} - {e.details()}")
             return False, None, f"gRPC error: {e.details()}"
+        except CircuitOpenError as e:
+            logger.warning(f"Skipped getting current user: {str(e)}")
+            return False, None, str(e)
         except Exception as e:
             logger.error(f"Unexpected error getting current user: {str(e)}")
             return False, None, f"Error: {str(e)}"
@@ -225,18 +307,59 @@ class AuthClient:
 
 # Singleton instance for convenience
 _default_client: Optional[AuthClient] = None
+_default_client_lock = threading.Lock()
 
 
 def get_auth_client() -> AuthClient:
     """Get the default auth client instance."""
     global _default_client
     if _default_client is None:
-        _default_client = AuthClient()
+        # Threaded workers can get here at the same time, only create one
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = AuthClient()
     return _default_client
 
 
 # Utility functions for common operations
 
+_UNSET = object()
+
+
+def extract_bearer_token(request) -> Optional[str]:
+    """
+    Return the bearer token from the Authorization header, or None.
+
+    The result is kept on the request, so the auth helpers that run for the
+    same request only parse the header once.
+    """
+    token = getattr(request, '_bearer_token', _UNSET)
+    if token is _UNSET:
+        auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+        token = auth_header[7:] if auth_header.startswith('Bearer ') else None
+        request._bearer_token = token
+    return token
+
+
+def verify_token_for_request(request, token: str) -> Tuple[bool, Optional[int]]:
+    """
+    Verify a token at most once per request.
+
+    Auth classes and helpers such as require_auth() can all run for the same
+    request, so the result is kept on the request and reused.
+
+    Returns:
+        Tuple of (is_valid, user_id)
+    """
+    cached = getattr(request, '_auth_cache', None)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    result = get_auth_client().verify_token(token)
+    request._auth_cache = (token, result)
+    return result
+
+
 def verify_request_token(request) -> Tuple[bool, Optional[int], str]:
     """
     Verify the token from a Django request.
@@ -247,17 +370,14 @@ def verify_request_token(request) -> Tuple[bool, Optional[int], str]:
     Returns:
         Tuple of (is_valid, user_id, error_message)
     """
-    auth_header = request.headers.get('Authorization', '')
-
-    if not auth_header:
-        return False, None, "No authorization header"
+    token = extract_bearer_token(request)
 
-    if not auth_header.startswith('Bearer '):
+    if token is None:
+        if not request.META.get('HTTP_AUTHORIZATION'):
+            return False, None, "No authorization header"
         return False, None, "Invalid authorization header format"
 
-    token = auth_header[7:]  # Remove 'Bearer ' prefix
-    client = get_auth_client()
-    is_valid, user_id = client.verify_token(token)
+    is_valid, user_id = verify_token_for_request(request, token)
 
     if not is_valid:
         return False, None, "Invalid or expired token"
@@ -275,11 +395,10 @@ def get_request_user(request) -> Tuple[bool, Optional[Dict[str, Any]], str]:
     Returns:
         Tuple of (success, user_data, error_message)
     """
-    auth_header = request.headers.get('Authorization', '')
+    token = extract_bearer_token(request)
 
-    if not auth_header or not auth_header.startswith('Bearer '):
+    if token is None:
         return False, None, "Invalid authorization"
 
-    token = auth_header[7:]
     client = get_auth_client()
     return client.get_current_user(token)
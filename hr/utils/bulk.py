@@ -0,0 +1,56 @@
+"""
+Bulk insert helpers for records that reference other microservices.
+"""
+
+from collections import defaultdict
+from typing import Iterable, List, Optional
+from django.db import models, transaction
+from hr.models.base import BulkCreateValidatedMixin
+from hr.utils.validators import validate_employee_ids_bulk
+
+
+def bulk_save_with_validation(
+    instances: Iterable[models.Model],
+    batch_size: Optional[int] = None,
+) -> List[models.Model]:
+    """
+    Validate and insert a mix of model instances in one transaction.
+
+    Employee IDs are collected across every instance and validated once, so
+    an ID shared by e.g. a payroll record and a leave request is only looked
+    up once and every invalid ID is reported before anything is written.
+    Each model's rows are then inserted with its bulk_create_validated().
+
+    Args:
+        instances: Unsaved instances of models using BulkCreateValidatedMixin
+        batch_size: Rows per INSERT, defaults to HR_BULK_CREATE_BATCH_SIZE
+
+    Returns:
+        list: The created instances, grouped by model
+
+    Raises:
+        ValidationError: If any employee ID or instance is invalid
+        TypeError: If a model doesn't use BulkCreateValidatedMixin
+    """
+    groups = defaultdict(list)
+    for instance in instances:
+        groups[type(instance)].append(instance)
+
+    for model in groups:
+        # employee_id_fields is read below as well, so require the mixin itself
+        if not issubclass(model, BulkCreateValidatedMixin):
+            raise TypeError(f"{model.__name__} does not support bulk_create_validated()")
+
+    validate_employee_ids_bulk({
+        getattr(instance, field)
+        for model, objs in groups.items()
+        for instance in objs
+        for field in model.employee_id_fields
+        if getattr(instance, field)
+    })
+
+    created = []
+    with transaction.atomic():
+        for model, objs in groups.items():
+            created.extend(model.bulk_create_validated(objs, batch_size=batch_size))
+    return created
@@ -0,0 +1,139 @@
+"""
+Local JWT verification for HR Service
+
+When AUTH_JWKS_URL is set, access tokens are verified in-process against
+the auth service's public signing keys instead of with a gRPC call. The
+keys are fetched once and refreshed periodically.
+
+Local verification only answers when it can be sure. If it is not
+configured or the token's signing key can't be found, callers fall back
+to asking the auth service. After a failed key fetch or an unknown key
+id, those tokens go straight to the auth service for a few seconds, so a
+burst of them doesn't refetch the key set on every request.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+from django.conf import settings
+import jwt
+
+logger = logging.getLogger(__name__)
+
+_jwk_client: Optional[jwt.PyJWKClient] = None
+_jwk_client_lock = threading.Lock()
+
+# When the key set may be fetched again, and unknown key ids with the time
+# they may be looked up again
+_jwks_retry_at = 0.0
+_unknown_kids = {}
+_UNKNOWN_KIDS_SIZE = 256
+
+
+def _retry_after() -> float:
+    return time.monotonic() + getattr(settings, 'AUTH_JWKS_RETRY_AFTER', 5)
+
+
+def _remember_unknown_kid(kid: Optional[str]) -> None:
+    _unknown_kids.pop(kid, None)
+    if len(_unknown_kids) >= _UNKNOWN_KIDS_SIZE:
+        # Dicts keep insertion order, so this is the oldest entry
+        _unknown_kids.pop(next(iter(_unknown_kids)), None)
+    _unknown_kids[kid] = _retry_after()
+
+
+def _backing_off(kid: Optional[str]) -> bool:
+    """Return True if the key set or this key id failed to load a moment ago."""
+    now = time.monotonic()
+    if _jwks_retry_at > now:
+        return True
+    retry_at = _unknown_kids.get(kid)
+    if retry_at is None:
+        return False
+    if retry_at <= now:
+        _unknown_kids.pop(kid, None)
+        return False
+    return True
+
+
+def get_jwk_client() -> Optional[jwt.PyJWKClient]:
+    """Get the shared JWKS client, or None if local verification is off."""
+    global _jwk_client
+    jwks_url = getattr(settings, 'AUTH_JWKS_URL', None)
+    if not jwks_url:
+        return None
+    if _jwk_client is None:
+        with _jwk_client_lock:
+            if _jwk_client is None:
+                _jwk_client = jwt.PyJWKClient(
+                    jwks_url,
+                    lifespan=getattr(settings, 'AUTH_JWKS_CACHE_TTL', 300),
+                    timeout=getattr(settings, 'AUTH_JWKS_TIMEOUT', 2.0),
+                )
+    return _jwk_client
+
+
+def verify_token_locally(token: str) -> Optional[Tuple[bool, Optional[int]]]:
+    """
+    Verify a JWT's signature and claims without calling the auth service.
+
+    Args:
+        token: JWT access token (without 'Bearer ' prefix)
+
+    Returns:
+        Tuple of (is_valid, user_id) like AuthClient.verify_token(), or None
+        if the token can't be checked locally and the auth service should
+        be asked instead.
+    """
+    global _jwks_retry_at
+
+    jwk_client = get_jwk_client()
+    if jwk_client is None:
+        return None
+
+    try:
+        kid = jwt.get_unverified_header(token).get('kid')
+    except jwt.InvalidTokenError:
+        return False, None
+
+    if _backing_off(kid):
+        return None
+
+    try:
+        signing_key = jwk_client.get_signing_key(kid)
+    except (jwt.PyJWKClientConnectionError, jwt.PyJWKError) as e:
+        # The key set couldn't be fetched or read
+        logger.warning(f"Local token verification unavailable: {str(e)}")
+        _jwks_retry_at = _retry_after()
+        return None
+    except jwt.PyJWKClientError as e:
+        # No key with this id, even after refetching the key set
+        logger.warning(f"Local token verification unavailable: {str(e)}")
+        _remember_unknown_kid(kid)
+        return None
+
+    audience = getattr(settings, 'AUTH_JWT_AUDIENCE', None)
+    options = {'require': ['exp']}
+    if not audience:
+        # PyJWT rejects any token with an aud claim when no audience is given
+        options['verify_aud'] = False
+
+    try:
+        payload = jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=getattr(settings, 'AUTH_JWT_ALGORITHMS', ['RS256', 'ES256', 'EdDSA']),
+            audience=audience,
+            issuer=getattr(settings, 'AUTH_JWT_ISSUER', None),
+            options=options,
+        )
+    except jwt.InvalidTokenError:
+        return False, None
+
+    user_id = payload.get(getattr(settings, 'AUTH_JWT_USER_ID_CLAIM', 'user_id'))
+    try:
+        return True, int(user_id)
+    except (ValueError, TypeError):
+        logger.warning(f"Could not convert user_id to int: {user_id}")
+        return False, None
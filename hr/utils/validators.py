@@ -8,280 +8,360 @@ Uses gRPC for efficient service-to-service communication.
 """
 
 import logging
+import threading
+import time
 import grpc
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Iterable, List
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.conf import settings
 
+from hr.grpc_clients import auth_client as _AUTH_CLIENT, department_client as _DEPT_CLIENT
+from hr.grpc_clients.circuit_breaker import CircuitBreaker, CircuitOpenError
+
 logger = logging.getLogger(__name__)
 
+# How long (in seconds) a lookup is reused before asking the service again.
+# Misses are kept briefly so bursts of bad ids don't all reach the service,
+# while newly created records are still picked up quickly.
+VALIDATION_CACHE_TIMEOUT = getattr(settings, 'HR_VALIDATION_CACHE_TIMEOUT', 300)
+VALIDATION_NEGATIVE_CACHE_TIMEOUT = getattr(settings, 'HR_VALIDATION_NEGATIVE_CACHE_TIMEOUT', 30)
 
-def validate_department_id(department_id: str) -> Dict:
-    """
-    Validate that a department ID exists in the department microservice using gRPC.
+# Lookups are also kept in process memory for a few seconds in front of the
+# shared cache, so IDs repeated within a worker skip the cache round-trip.
+# Kept short since invalidate_employee_cache() only clears the calling process.
+VALIDATION_LOCAL_CACHE_TIMEOUT = getattr(settings, 'HR_VALIDATION_LOCAL_CACHE_TIMEOUT', 10)
+VALIDATION_LOCAL_CACHE_SIZE = 1024
 
-    Args:
-        department_id: The department ID to validate
+_local_cache = {}
+_local_cache_lock = threading.Lock()
 
-    Returns:
-        dict: Department information if valid
+# One breaker per service, so while a service is down validations against it
+# fail at once instead of each waiting for a connection timeout
+_BREAKERS = {
+    service: CircuitBreaker(
+        service,
+        fail_max=getattr(settings, 'HR_VALIDATION_CIRCUIT_FAIL_MAX', 3),
+        reset_timeout=getattr(settings, 'HR_VALIDATION_CIRCUIT_RESET_TIMEOUT', 5),
+    )
+    for service in ('Auth', 'Department')
+}
 
-    Raises:
-        ValidationError: If department_id is invalid or not found
+# Runs the reference checks of a single record side by side, see validate_references()
+_reference_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hr-validate')
+
+# Cleared when the auth service answers ValidateEmployees with UNIMPLEMENTED
+_bulk_rpc_supported = True
+
+
+def _cached_lookup(key: str, lookup) -> Dict:
+    """
+    Return a cached gRPC validation result, calling lookup() on a cache miss.
     """
-    if not department_id:
-        raise ValidationError("Department ID is required")
+    result = _local_get(key)
+    if result is None:
+        result = cache.get(key)
+        if result is None:
+            result = lookup()
+            _store_lookup(key, result)
+        else:
+            _local_set(key, result)
+    return result
 
-    try:
-        from hr.grpc_clients import department_client
 
-        result = department_client.validate_department(department_id)
+def _lookup_timeout(result: Dict) -> int:
+    return VALIDATION_CACHE_TIMEOUT if result['exists'] else VALIDATION_NEGATIVE_CACHE_TIMEOUT
 
-        if not result['exists']:
-            raise ValidationError(
-                f"Department with ID '{department_id}' does not exist in the department service"
-            )
 
-        # Check if department is active
-        if result['department'] and not result['department'].get('is_active', True):
-            raise ValidationError(
-                f"Department with ID '{department_id}' is not active"
-            )
+def _store_lookup(key: str, result: Dict) -> None:
+    cache.set(key, result, _lookup_timeout(result))
+    _local_set(key, result)
 
-        return result['department']
 
-    except grpc.RpcError as e:
-        if e.code() == grpc.StatusCode.UNAVAILABLE:
-            logger.error(f"Department service is unavailable: {e.details()}")
-            raise ValidationError(
-                "Unable to validate department ID - Department service is unavailable"
-            )
-        else:
-            logger.error(f"gRPC error validating department: {e.code()} - {e.details()}")
-            raise ValidationError(
-                f"{e.details()}"
-            )
-        
-    except ValidationError as e:
-        raise ValidationError(e.messages[0])
+def _local_get(key: str) -> Optional[Dict]:
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at <= time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    return result
 
-    except Exception as e:
-        logger.error(f"Unexpected error validating department {department_id}: {str(e)}")
-        raise ValidationError(f"{str(e)}")
 
+def _local_set(key: str, result: Dict) -> None:
+    timeout = min(VALIDATION_LOCAL_CACHE_TIMEOUT, _lookup_timeout(result))
+    if timeout <= 0:
+        return
+    with _local_cache_lock:
+        _local_cache.pop(key, None)
+        if len(_local_cache) >= VALIDATION_LOCAL_CACHE_SIZE:
+            # Dicts keep insertion order, so this is the oldest entry
+            _local_cache.pop(next(iter(_local_cache)), None)
+        _local_cache[key] = (time.monotonic() + timeout, result)
 
-def validate_sub_department_id(sub_department_id: str) -> Dict:
-    """
-    Validate that a sub-department ID exists in the department microservice using gRPC.
 
-    Args:
-        sub_department_id: The sub-department ID to validate
+def invalidate_employee_cache(employee_id: str) -> None:
+    """
+    Drop the cached lookup for an employee, e.g. when the auth service reports
+    that the employee was created, deactivated or deleted.
+    """
+    key = f"validate_employee:{employee_id}"
+    cache.delete(key)
+    _local_cache.pop(key, None)
 
-    Returns:
-        dict: Sub-department information if valid
 
-    Raises:
-        ValidationError: If sub_department_id is invalid or not found
+def _entity_from_result(entity_id: str, result: Dict, result_key: str, label: str, service: str) -> Dict:
     """
-    if not sub_department_id:
-        raise ValidationError("Sub-department ID is required")
+    Return the record from a validation result, raising ValidationError if it
+    does not exist or is not active.
+    """
+    if not result['exists']:
+        raise ValidationError(
+            f"{label} with ID '{entity_id}' does not exist in the {service.lower()} service"
+        )
 
-    try:
-        from hr.grpc_clients import department_client
+    entity = result[result_key]
+    if entity and not entity.get('is_active', True):
+        raise ValidationError(
+            f"{label} with ID '{entity_id}' is not active"
+        )
 
-        result = department_client.validate_sub_department(sub_department_id)
+    return entity
 
-        if not result['exists']:
-            raise ValidationError(
-                f"Sub-department with ID '{sub_department_id}' does not exist in the department service"
-            )
 
-        # Check if sub-department is active
-        if result['sub_department'] and not result['sub_department'].get('is_active', True):
-            raise ValidationError(
-                f"Sub-department with ID '{sub_department_id}' is not active"
-            )
+# Messages for gRPC failures that mean the service couldn't answer. Any
+# other status is reported with the details sent by the service.
+_RPC_ERROR_MESSAGES = {
+    grpc.StatusCode.UNAVAILABLE: "Unable to validate {label} ID - {service} service is unavailable",
+    grpc.StatusCode.DEADLINE_EXCEEDED: "Unable to validate {label} ID - {service} service timed out",
+}
 
-        return result['sub_department']
 
-    except grpc.RpcError as e:
-        if e.code() == grpc.StatusCode.UNAVAILABLE:
-            logger.error(f"Department service is unavailable: {e.details()}")
-            raise ValidationError(
-                "Unable to validate sub-department ID - Department service is unavailable"
-            )
-        else:
-            logger.error(f"gRPC error validating sub-department: {e.code()} - {e.details()}")
-            raise ValidationError(
-                f"{e.details()}"
-            )
-        
-    except ValidationError as e:
-        raise ValidationError(e.messages[0])
+def _rpc_validation_error(e: grpc.RpcError, label: str, service: str) -> ValidationError:
+    """Log a failed gRPC lookup and return the ValidationError to raise for it."""
+    message = _RPC_ERROR_MESSAGES.get(e.code())
+    if message is None:
+        logger.error(f"gRPC error validating {label.lower()}: {e.code()} - {e.details()}")
+        return ValidationError(
+            f"{e.details()}"
+        )
 
-    except Exception as e:
-        logger.error(f"Unexpected error validating sub-department {sub_department_id}: {str(e)}")
-        raise ValidationError(f"{str(e)}")
+    logger.error(f"{service} service error validating {label.lower()}: {e.code()} - {e.details()}")
+    return ValidationError(message.format(label=label.lower(), service=service))
 
 
-def validate_employee_id(employee_id: str) -> Dict:
-    """
-    Validate that an employee ID exists in the auth microservice using gRPC.
+def _unavailable_error(label: str, service: str) -> ValidationError:
+    return ValidationError(
+        _RPC_ERROR_MESSAGES[grpc.StatusCode.UNAVAILABLE].format(label=label.lower(), service=service)
+    )
+
+
+def _validator_doc(label: str, service: str) -> str:
+    return f"""
+    Validate that a {label.lower()} ID exists in the {service.lower()} microservice using gRPC.
 
     Args:
-        employee_id: The employee ID to validate
+        entity_id: The {label.lower()} ID to validate
 
     Returns:
-        dict: Employee information if valid
+        dict: {label} information if valid
 
     Raises:
-        ValidationError: If employee_id is invalid or not found
+        ValidationError: If the ID is invalid or not found
     """
-    if not employee_id:
-        raise ValidationError("Employee ID is required")
-
-    try:
-        from hr.grpc_clients import auth_client
 
-        result = auth_client.validate_employee(employee_id)
 
-        if not result['exists']:
-            raise ValidationError(
-                f"Employee with ID '{employee_id}' does not exist in the auth service"
-            )
+def _make_validator(client, method: str, result_key: str, label: str, service: str):
+    """
+    Build a validate_<result_key>_id() function that looks IDs up with
+    client.<method>(), caching results and turning failures into
+    ValidationError.
 
-        # Verify employee is active
-        if result['employee'] and not result['employee'].get('is_active', True):
-            raise ValidationError(
-                f"Employee with ID '{employee_id}' is not active"
-            )
+    Args:
+        client: gRPC client singleton to call
+        method: Name of the client method returning {'exists', result_key, 'message'}
+        result_key: Key of the record in the result, also used in the cache key
+        label: Entity name used in messages, e.g. 'Employee'
+        service: Service name used in messages, e.g. 'Auth'
+    """
+    breaker = _BREAKERS[service]
 
-        return result['employee']
+    def validator(entity_id: str) -> Dict:
+        if not entity_id:
+            raise ValidationError(f"{label} ID is required")
 
-    except grpc.RpcError as e:
-        if e.code() == grpc.StatusCode.UNAVAILABLE:
-            logger.error(f"Auth service is unavailable: {e.details()}")
-            raise ValidationError(
-                "Unable to validate employee ID - Auth service is unavailable"
-            )
-        else:
-            logger.error(f"gRPC error validating employee: {e.code()} - {e.details()}")
-            raise ValidationError(
-                f"{e.details()}"
+        try:
+            result = _cached_lookup(
+                f"validate_{result_key}:{entity_id}",
+                lambda: breaker.call(getattr(client, method), entity_id)
             )
-        
-    except ValidationError as e:
-        raise ValidationError(e.messages[0])
 
-    except Exception as e:
-        logger.error(f"Unexpected error validating employee {employee_id}: {str(e)}")
-        raise ValidationError(f"{str(e)}")
+            return _entity_from_result(entity_id, result, result_key, label, service)
 
+        except CircuitOpenError:
+            raise _unavailable_error(label, service)
 
-def validate_user_id(user_id: str) -> Dict:
-    """
-    Validate that a user ID exists in the auth microservice using gRPC.
+        except grpc.RpcError as e:
+            raise _rpc_validation_error(e, label, service)
 
-    Args:
-        user_id: The user ID to validate
+        except ValidationError as e:
+            raise ValidationError(e.messages[0])
 
-    Returns:
-        dict: User information if valid
+        except Exception as e:
+            logger.error(f"Unexpected error validating {label.lower()} {entity_id}: {str(e)}")
+            raise ValidationError(f"{str(e)}")
 
-    Raises:
-        ValidationError: If user_id is invalid or not found
-    """
-    if not user_id:
-        raise ValidationError("User ID is required")
+    validator.__name__ = validator.__qualname__ = f"validate_{result_key}_id"
+    validator.__doc__ = _validator_doc(label, service)
+    return validator
 
-    try:
-        from hr.grpc_clients import auth_client
 
-        result = auth_client.validate_user(user_id)
+validate_department_id = _make_validator(_DEPT_CLIENT, 'validate_department', 'department', 'Department', 'Department')
+validate_sub_department_id = _make_validator(
+    _DEPT_CLIENT, 'validate_sub_department', 'sub_department', 'Sub-department', 'Department'
+)
+validate_employee_id = _make_validator(_AUTH_CLIENT, 'validate_employee', 'employee', 'Employee', 'Auth')
+validate_user_id = _make_validator(_AUTH_CLIENT, 'validate_user', 'user', 'User', 'Auth')
+validate_branch_id = _make_validator(_AUTH_CLIENT, 'validate_branch', 'branch', 'Branch', 'Auth')
 
-        if not result['exists']:
-            raise ValidationError(
-                f"User with ID '{user_id}' does not exist in the auth service"
-            )
 
-        # Verify user is active
-        if result['user'] and not result['user'].get('is_active', True):
-            raise ValidationError(
-                f"User with ID '{user_id}' is not active"
-            )
+def _fetch_employees(employee_ids: List[str]) -> Dict[str, Dict]:
+    global _bulk_rpc_supported
 
-        return result['user']
+    breaker = _BREAKERS['Auth']
 
-    except grpc.RpcError as e:
-        if e.code() == grpc.StatusCode.UNAVAILABLE:
-            logger.error(f"Auth service is unavailable: {e.details()}")
-            raise ValidationError(
-                "Unable to validate user ID - Auth service is unavailable"
-            )
-        else:
-            logger.error(f"gRPC error validating user: {e.code()} - {e.details()}")
-            raise ValidationError(
-                f"{e.details()}"
-            )
-        
-    except ValidationError as e:
-        raise ValidationError(e.messages[0])
+    if _bulk_rpc_supported:
+        try:
+            return breaker.call(_AUTH_CLIENT.validate_employees, employee_ids)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            # Older auth service, send concurrent single lookups from now on
+            logger.warning("Auth service does not implement ValidateEmployees, validating one by one")
+            _bulk_rpc_supported = False
 
-    except Exception as e:
-        logger.error(f"Unexpected error validating user {user_id}: {str(e)}")
-        raise ValidationError(f"{str(e)}")
+    return breaker.call(_AUTH_CLIENT.validate_employees_each, employee_ids)
 
 
-def validate_branch_id(branch_id: str) -> Dict:
+def validate_employee_ids_bulk(employee_ids: Iterable[str]) -> Dict[str, Dict]:
     """
-    Validate that a branch ID exists in the auth microservice using gRPC.
+    Validate several employee IDs in one pass.
+
+    Cached lookups are read from process memory or with one get_many() and
+    the rest are sent to the auth service in a single ValidateEmployees call,
+    falling back to concurrent per-ID calls if the service doesn't
+    implement it.
 
     Args:
-        branch_id: The branch ID to validate
+        employee_ids: The employee IDs to validate
 
     Returns:
-        dict: Branch information if valid
+        dict: Employee information keyed by employee ID
 
     Raises:
-        ValidationError: If branch_id is invalid or not found
+        ValidationError: With one message per invalid employee ID
+    """
+    employee_ids = list(dict.fromkeys(employee_ids))
+    keys = {employee_id: f"validate_employee:{employee_id}" for employee_id in employee_ids if employee_id}
+    lookups = {}
+    for employee_id, key in keys.items():
+        result = _local_get(key)
+        if result is not None:
+            lookups[employee_id] = result
+
+    cached = cache.get_many([key for employee_id, key in keys.items() if employee_id not in lookups])
+    for employee_id, key in keys.items():
+        if key in cached:
+            lookups[employee_id] = cached[key]
+            _local_set(key, cached[key])
+
+    missing = [employee_id for employee_id in keys if employee_id not in lookups]
+    if missing:
+        try:
+            fetched = _fetch_employees(missing)
+        except CircuitOpenError:
+            raise _unavailable_error('Employee', 'Auth')
+
+        except grpc.RpcError as e:
+            raise _rpc_validation_error(e, 'Employee', 'Auth')
+
+        for employee_id, result in fetched.items():
+            _store_lookup(keys[employee_id], result)
+        lookups.update(fetched)
+
+    results = {}
+    errors = []
+
+    for employee_id in employee_ids:
+        try:
+            if employee_id in lookups:
+                results[employee_id] = _entity_from_result(
+                    employee_id, lookups[employee_id], 'employee', 'Employee', 'Auth'
+                )
+            else:
+                results[employee_id] = validate_employee_id(employee_id)
+        except ValidationError as e:
+            errors.append(e.messages[0])
+
+    if errors:
+        raise ValidationError(errors)
+
+    return results
+
+
+async def avalidate_employee_ids(employee_ids: Iterable[str]) -> Dict[str, Dict]:
     """
-    if not branch_id:
-        raise ValidationError("Branch ID is required")
+    Async version of validate_employee_ids_bulk() for async views.
 
-    try:
-        from hr.grpc_clients import auth_client
+    The bulk lookup runs in a worker thread, so the event loop isn't blocked
+    and the IDs still go to the auth service in one call over the shared
+    channel.
 
-        result = auth_client.validate_branch(branch_id)
+    Args:
+        employee_ids: The employee IDs to validate
 
-        if not result['exists']:
-            raise ValidationError(
-                f"Branch with ID '{branch_id}' does not exist in the auth service"
-            )
+    Returns:
+        dict: Employee information keyed by employee ID
 
-        # Check if branch is active
-        if result['branch'] and not result['branch'].get('is_active', True):
-            raise ValidationError(
-                f"Branch with ID '{branch_id}' is not active"
-            )
+    Raises:
+        ValidationError: With one message per invalid employee ID
+    """
+    return await sync_to_async(validate_employee_ids_bulk, thread_sensitive=False)(list(employee_ids))
 
-        return result['branch']
 
-    except grpc.RpcError as e:
-        if e.code() == grpc.StatusCode.UNAVAILABLE:
-            logger.error(f"Auth service is unavailable: {e.details()}")
-            raise ValidationError(
-                "Unable to validate branch ID - Auth service is unavailable"
-            )
-        else:
-            logger.error(f"gRPC error validating branch: {e.code()} - {e.details()}")
-            raise ValidationError(
-                f"{e.details()}"
-            )
-        
-    except ValidationError as e:
-        logger.error(f"Unexpected error validating branch {branch_id}: {str(e)}")
-        raise ValidationError(e.messages[0])
-
-    except Exception as e:
-        logger.error(f"Unexpected error validating branch {branch_id}: {str(e)}")
-        raise ValidationError(f"{str(e)}")
+def validate_references(checks: Dict[str, tuple]) -> Dict[str, str]:
+    """
+    Run the validators for several ID fields of one record at once.
+
+    The IDs usually belong to different services, e.g. a department and a
+    branch, so they can't share one RPC. Running the lookups concurrently
+    makes a save wait for about one round-trip instead of one per field.
+
+    Args:
+        checks: (validator, value) pairs keyed by field name
+
+    Returns:
+        dict: Error message keyed by field name, for the fields that failed
+    """
+    if len(checks) > 1:
+        outcomes = {
+            field: _reference_executor.submit(validator, value).result
+            for field, (validator, value) in checks.items()
+        }
+    else:
+        outcomes = {
+            field: partial(validator, value)
+            for field, (validator, value) in checks.items()
+        }
+
+    errors = {}
+    for field, outcome in outcomes.items():
+        try:
+            outcome()
+        except ValidationError as e:
+            errors[field] = e.messages[0]
+    return errors